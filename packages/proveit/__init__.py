@@ -60,7 +60,8 @@ from . import magics
 
 # So we can reset back to the basics.
 from .decorators import (_equality_prover_fn_to_tenses,
-                         _equality_prover_name_to_tenses)
+                         _equality_prover_name_to_tenses,
+                         _irreducible_reflexivity)
 _basic_equality_prover_fn_to_tenses = _equality_prover_fn_to_tenses.copy()
 _basic_equality_prover_name_to_tenses = _equality_prover_name_to_tenses.copy()
 
@@ -75,6 +76,8 @@ def reset():
     Expression._clear_()
     Literal._clear_()
     Operation._clear_()
+    ExprTuple._clear_()
+    Conditional._clear_()
     Judgment._clear_()
     Proof._clear_()
     Theory._clear_()
@@ -84,6 +87,7 @@ def reset():
     _equality_prover_name_to_tenses.clear()
     _equality_prover_name_to_tenses.update(
         _basic_equality_prover_name_to_tenses)
+    _irreducible_reflexivity.clear()
     if hasattr(magics, 'prove_it_magic'):
         magics.prove_it_magic.reset()
     from proveit._core_._unique_data import clear_unique_data
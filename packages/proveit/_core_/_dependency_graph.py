@@ -5,6 +5,8 @@ also a sort of dependency graph where the expression "depends" upon
 sub-expressions.  The inverse relationship of a dependency is a requirement.
 '''
 
+from collections import deque
+
 
 def ordered_dependency_nodes(root_node, requirements_fn):
     '''
@@ -18,19 +20,22 @@ def ordered_dependency_nodes(root_node, requirements_fn):
     '''
     # nodes_with_repeats allows duplicate dependent nodes in a first pass.
     # Remove the duplicates in a second pass below.
-    queue = [root_node]
+    queue = deque([root_node])
     nodes_with_repeats = []
     while len(queue) > 0:
-        next_node = queue.pop(0)
+        next_node = queue.popleft()
         nodes_with_repeats.append(next_node)
         queue.extend(requirements_fn(next_node))
     # Second pass: remove duplicates.  Requirements should always come later
     # (presenting the graph in a way that guarantees that it is acyclic).
+    # The nodes are collected in reverse order and then flipped at the
+    # end (rather than inserting each at the front).
     visited = set()
     enumerated_nodes = []
     for node in reversed(nodes_with_repeats):
         if node in visited:
             continue
-        enumerated_nodes.insert(0, node)
+        enumerated_nodes.append(node)
         visited.add(node)
+    enumerated_nodes.reverse()
     return enumerated_nodes
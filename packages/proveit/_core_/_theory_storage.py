@@ -11,8 +11,8 @@ import re
 import urllib.request
 import urllib.parse
 import urllib.error
-import imp
 import bisect
+import locale
 from collections import deque
 
 
@@ -23,6 +23,30 @@ def relurl(path, start='.'):
     return urllib.request.pathname2url(os.path.relpath(path, start))
 
 
+def _read_small_file(path):
+    '''
+    Return the text contained in the file at the given path using
+    direct os.open/os.read calls.  This is meant for the many small
+    unique_rep.pv_it files, skipping the buffered text stream set-up
+    of open().  The result matches reading in text mode (default
+    encoding and universal newlines).
+    '''
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        chunks = []
+        while True:
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+    text = b''.join(chunks).decode(locale.getpreferredencoding(False))
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+
 class TheoryStorage:
     '''
     Manages the __pv_it directory of a Theory, the distributed database
@@ -32,6 +56,10 @@ class TheoryStorage:
     directory which can all be re-generated).
     '''
 
+    # Descriptions of the special object kinds for error messages.
+    _kind_to_str = {'axiom': 'an axiom', 'theorem': 'a theorem',
+                    'common': 'a common expression'}
+
     def __init__(self, theory, name, directory, root_directory):
         from .theory import Theory, TheoryException
 
@@ -39,19 +67,23 @@ class TheoryStorage:
             raise TheoryException("'theory' should be a Theory object")
         self.theory = theory
         self.name = name
-        if root_directory is None:
-            self.root_theory_storage = self
-        else:
-            self.root_theory_storage = Theory(root_directory)._storage
+        # The root TheoryStorage is obtained upon request (see the
+        # root_theory_storage property) unless the root theory has
+        # not been registered yet; creating the root registers its
+        # directory and adds it to sys.path if needed.
+        self._root_directory = root_directory
+        self._root_theory_storage = None
+        if (root_directory is not None and
+                name.split('.')[0] not in Theory._rootTheoryPaths):
+            self._root_theory_storage = Theory(root_directory)._storage
         self.directory = directory
         self.pv_it_dir = os.path.join(self.directory, '__pv_it')
-        if not os.path.isdir(self.pv_it_dir):
-            # make the __pv_it directory
-            try:
-                os.makedirs(self.pv_it_dir)
-            except (OSError, FileExistsError):
-                # maybe another processor beat us to it.
-                pass
+        # make the __pv_it directory if it doesn't exist yet
+        # (exist_ok in case another processor beats us to it).
+        try:
+            os.makedirs(self.pv_it_dir, exist_ok=True)
+        except OSError:
+            pass
 
         if self.is_root():
             # If this is a root theory, let's add the directory above
@@ -104,10 +136,8 @@ class TheoryStorage:
         if not os.path.isfile(sub_theories_path):
             open(sub_theories_path, 'wt').close()
 
-        self.sub_theory_names = []
         with open(sub_theories_path, 'rt') as f:
-            for k, line in enumerate(f.readlines()):
-                self.sub_theory_names.append(line.strip())
+            self.sub_theory_names = [line.strip() for line in f]
 
         # Map (kind, name) pair to the hash of the corresponding
         # special object (Axiom, Theorem, or Expression of a common
@@ -129,6 +159,11 @@ class TheoryStorage:
                                       'theorem': None}
         self._special_obj_hash_ids = {'common': None, 'axiom': None,
                                       'theorem': None}
+        # Modification times (in ns) of the name_to_expr_and_obj_hashes.txt
+        # files when they were last read, to know when the above
+        # dictionaries may be reused.
+        self._special_names_mtime = {'common': None, 'axiom': None,
+                                     'theorem': None}
 
         # Names of axioms, theorems, and common expressions that have
         # been read in and not in need of an update.
@@ -152,12 +187,26 @@ class TheoryStorage:
         # objects.
         self._folder_storage_dict = dict()
 
+    @property
+    def root_theory_storage(self):
+        '''
+        The TheoryStorage of the root theory containing this one.
+        '''
+        if self._root_theory_storage is None:
+            if self._root_directory is None:
+                self._root_theory_storage = self
+            else:
+                from .theory import Theory
+                self._root_theory_storage = \
+                    Theory(self._root_directory)._storage
+        return self._root_theory_storage
+
     def is_root(self):
         '''
         Return True iff this TheoryStorage is a "root" TheoryStorage
         (no parent directory with an __init__.py file).
         '''
-        return self.root_theory_storage is self
+        return self._root_directory is None
 
     def get_sub_theory_names(self):
         '''
@@ -171,8 +220,8 @@ class TheoryStorage:
         '''
         self.sub_theory_names = sub_theory_names
         with open(os.path.join(self.directory, '_sub_theories_.txt'), 'wt') as f:
-            for sub_theory_name in self.sub_theory_names:
-                f.write(sub_theory_name + '\n')
+            f.writelines(sub_theory_name + '\n' for sub_theory_name
+                         in self.sub_theory_names)
 
     def append_sub_theory_name(self, sub_theory_name):
         '''
@@ -187,10 +236,11 @@ class TheoryStorage:
         Return the TheoryFolderStorage object associated with the
         theory of this TheoryStorage and the folder.
         '''
-        if folder not in self._folder_storage_dict:
-            self._folder_storage_dict[folder] = \
+        theory_folder_storage = self._folder_storage_dict.get(folder)
+        if theory_folder_storage is None:
+            theory_folder_storage = self._folder_storage_dict[folder] = \
                 TheoryFolderStorage(self, folder)
-        return self._folder_storage_dict[folder]
+        return theory_folder_storage
 
     def _updatePath(self):
         '''
@@ -218,12 +268,14 @@ class TheoryStorage:
         with open(self.paths_filename) as paths_file:
             prev_lines = paths_file.readlines()
         # re-write the paths.txt with one of the theories' path changed
+        new_lines = []
+        for path_line in prev_lines:
+            theory_name, path = path_line.split()
+            if theory_name == moved_theory_name:
+                path = new_path
+            new_lines.append(theory_name + ' ' + path + '\n')
         with open(self.paths_filename, 'w') as paths_file:
-            for path_line in prev_lines:
-                theory_name, path = path_line.split()
-                if theory_name == moved_theory_name:
-                    path = new_path
-                paths_file.write(theory_name + ' ' + path + '\n')
+            paths_file.writelines(new_lines)
 
     def _includeReference(self, referenced_theory):
         '''
@@ -323,8 +375,10 @@ class TheoryStorage:
         Set the common expressions, axioms, or theorems of the theory.
         '''
         from proveit._core_.proof import Axiom, Theorem
+        self._clear_theory_package_attrs()
         if kind == 'common':
             self._common_expr_names = None  # force a reload
+            self._loadedCommonExprs = dict()
         elif kind == 'axiom' or kind == 'theorem':
             if kind == 'axiom':
                 # Convert definitions from expressions to Axiom Proofs.
@@ -342,6 +396,16 @@ class TheoryStorage:
             self.theory_folder_storage(kind + 's')
         self._set_special_objects(definitions, kind)
 
+    def _clear_theory_package_attrs(self):
+        '''
+        Make the theory package (if it has been imported) forget the
+        special objects it has stored as attributes.
+        '''
+        from .theory import TheoryPackage
+        theory_package = sys.modules.get(self.name)
+        if isinstance(theory_package, TheoryPackage):
+            theory_package._clear_cached_attrs()
+
     def _set_special_objects(self, definitions, kind):
         '''
         Given the definitions dictionary of names to objects of type
@@ -364,7 +428,7 @@ class TheoryStorage:
         orig_lines = []
         if os.path.isfile(name_to_expr_and_obj_hashes_file):
             with open(name_to_expr_and_obj_hashes_file, 'r') as f:
-                for line in f.readlines():
+                for line in f:
                     orig_lines.append(line.rstrip())
                     name, expr_hash_id, obj_hash_id = line.split()
                     expr_hash_id_to_old_name[expr_hash_id] = name
@@ -373,14 +437,18 @@ class TheoryStorage:
         # for tracking modified objects
         modified_expr_hash_ids = set()
 
+        # record the special expressions in this theory object
+        theory_folder_storage = self.theory_folder_storage(folder)
+        objhash_to_names = theory_folder_storage._objhash_to_names
+        folder_path = theory_folder_storage.path
+        # the new name-to-hash lines, built along the way
+        new_lines = []
+
         for name, obj in definitions.items():
             if kind == 'common':
                 expr = obj
             else:
                 expr = obj.proven_truth.expr
-            # record the special expression in this theory object
-            theory_folder_storage = \
-                self.theory._theory_folder_storage(folder)
             # get both the expr hash id and the obj hash id
             # to be stored in the database 
             hash_id = theory_folder_storage._prove_it_storage_id(obj)
@@ -389,15 +457,14 @@ class TheoryStorage:
             else:
                 expr_id = theory_folder_storage._prove_it_storage_id(expr)
 
-            if expr_id in expr_hash_id_to_old_name:
-                if expr_hash_id_to_old_name[expr_id] != name:
-                    # obj has same expression as before, but new name
-                    print("Renaming {} to {}".format(
-                            expr_hash_id_to_old_name[expr_id], name))
-                expr_hash_id_to_old_name.pop(expr_id)
+            old_name = expr_hash_id_to_old_name.pop(expr_id, None)
+            if old_name is not None and old_name != name:
+                # obj has same expression as before, but new name
+                print("Renaming {} to {}".format(old_name, name))
 
             special_expr_hash_ids[name] = expr_id
             special_obj_hash_ids[name] = hash_id
+            new_lines.append(name + ' ' + expr_id + ' ' + hash_id)
 
             self._kindname_to_exprhash[(kind, name)] = expr_id
             self._kindname_to_objhash[(kind, name)]  = hash_id
@@ -406,34 +473,32 @@ class TheoryStorage:
             # changed for an axiom, theorem, or common expr, the
             # expr_id (a hash of the expr) would be the same as
             # before and get mapped to the new name.
-            theory_folder_storage._objhash_to_names.setdefault(
-                expr_id, []).append(name)
-            theory_folder_storage._objhash_to_names.setdefault(
-                hash_id, []).append(name)
+            objhash_to_names.setdefault(expr_id, []).append(name)
+            objhash_to_names.setdefault(hash_id, []).append(name)
 
             if folder != 'common':
                 # b/c folder is 'theorems' or 'axioms' (i.e. plural)
                 kind = folder[:-1]
 
-                if name not in old_name_to_expr_hash_id:
+                old_expr_id = old_name_to_expr_hash_id.get(name)
+                if old_expr_id is None:
                     # added special object or just changed a name
                     print('Adding {} {} to {} theory'.
                           format(kind, name, theory_name))
-                elif old_name_to_expr_hash_id[name] != expr_id:
+                elif old_expr_id != expr_id:
                     # modified the content of axiom or theorem,
                     # kept name the same
                     print('Modifying {} {} in {} theory.'.
                           format(kind, name, theory_name))
-                    modified_expr_hash_ids.add(old_name_to_expr_hash_id[name])
+                    modified_expr_hash_ids.add(old_expr_id)
 
                 # Also make sure there is a "used_by" sub-folder.
-                used_by_folder = os.path.join(self.pv_it_dir, folder,
-                                              hash_id, 'used_by')
-                if not os.path.isdir(used_by_folder):
-                    try:
-                        os.mkdir(used_by_folder)
-                    except OSError:
-                        pass  # no worries
+                used_by_folder = os.path.join(folder_path, hash_id,
+                                              'used_by')
+                try:
+                    os.mkdir(used_by_folder)
+                except OSError:
+                    pass  # already there; no worries
 
         # Indicate special expression removals.
         for expr_id, name in expr_hash_id_to_old_name.items():
@@ -455,46 +520,35 @@ class TheoryStorage:
                         self.theory, kind, hash_id)
 
         # Now we write the new name-to-hash information.
-        names = definitions.keys()
-        self._update_name_to_kind(names, kind)
-        new_lines = []
-        for name in names:
-            new_lines.append(name + ' '
-                    + special_expr_hash_ids[name] + ' '
-                    + special_obj_hash_ids[name])
+        self._update_name_to_kind(definitions.keys(), kind)
         if new_lines != orig_lines:
             with open(name_to_expr_and_obj_hashes_file, 'w') as f:
-                for line in new_lines:
-                    f.write(line + '\n')
+                f.writelines(line + '\n' for line in new_lines)
     
     def _update_name_to_kind(self, names, kind):
-        kind_to_str = {'axiom':'an axiom', 'theorem':'a theorem',
-                       'common':'a common expression'}
+        kind_to_str = TheoryStorage._kind_to_str
         for name in names:
-            if name in self._name_to_kind:
-                if self._name_to_kind[name] != kind:
-                    raise ValueError("'%s' is an overused name, as %s and %s."
-                                     %(name, kind_to_str[kind], 
-                                       self._name_to_kind[name]))
-            else:
-                self._name_to_kind[name] = kind
+            prev_kind = self._name_to_kind.setdefault(name, kind)
+            if prev_kind != kind:
+                raise ValueError("'%s' is an overused name, as %s and %s."
+                                 %(name, kind_to_str[kind], prev_kind))
 
     def get_axiom_names(self):
         if self._axiom_names is None:
-            self._axiom_names = list(self._loadSpecialStatementNames('axiom'))
+            self._axiom_names = list(self._load_special_names('axiom'))
             self._update_name_to_kind(self._axiom_names, 'axiom')
         return self._axiom_names
 
     def get_theorem_names(self):
         if self._theorem_names is None:
             self._theorem_names = list(
-                self._loadSpecialStatementNames('theorem'))
+                self._load_special_names('theorem'))
             self._update_name_to_kind(self._theorem_names, 'theorem')
         return self._theorem_names
 
     def get_common_expression_names(self):
         if self._common_expr_names is None:
-            self._common_expr_names = list(self._loadCommonExpressionNames())
+            self._common_expr_names = list(self._load_special_names('common'))
             self._update_name_to_kind(self._common_expr_names, 'common')
         return self._common_expr_names
 
@@ -523,27 +577,35 @@ class TheoryStorage:
                 # be generated
                 list(self._load_special_names(kind))
 
-    def _loadCommonExpressionNames(self):
-        return self._load_special_names('common')
-
-    def _loadSpecialStatementNames(self, kind):
-        return self._load_special_names(kind)
-
     def _load_special_names(self, kind):
         '''
         Yield names of axioms/theorems or common expressions.
+        The file is only re-read if it was modified since it was
+        last read.
         '''
         folder = TheoryStorage._kind_to_folder(kind)
         theory_folder_storage = self.theory_folder_storage(folder)
         name_to_expr_and_obj_hashes_filename = os.path.join(
                 self.pv_it_dir, folder, 'name_to_expr_and_obj_hashes.txt')
+        try:
+            mtime = os.stat(name_to_expr_and_obj_hashes_filename).st_mtime_ns
+        except FileNotFoundError:
+            mtime = None
+
+        special_expr_hash_ids = self._special_expr_hash_ids[kind]
+        if (special_expr_hash_ids is not None and mtime is not None
+                and mtime == self._special_names_mtime[kind]):
+            # Unchanged since it was last read.
+            yield from list(special_expr_hash_ids.keys())
+            return
+        self._special_names_mtime[kind] = mtime
 
         special_expr_hash_ids = self._special_expr_hash_ids[kind] = dict()
         special_obj_hash_ids  = self._special_obj_hash_ids[kind]  = dict()
 
-        if os.path.isfile(name_to_expr_and_obj_hashes_filename):
+        if mtime is not None:
             with open(name_to_expr_and_obj_hashes_filename, 'r') as f:
-                for line in f.readlines():
+                for line in f:
                     name, expr_hash_id, obj_hash_id = line.split()
                     special_expr_hash_ids[name] = expr_hash_id
                     special_obj_hash_ids[name] = obj_hash_id
@@ -563,11 +625,11 @@ class TheoryStorage:
         folder).
         '''
         list(self._load_special_names('axiom'))
-        try:
-            return self._special_obj_hash_ids['axiom'][name]
-        except KeyError:
+        hash_id = self._special_obj_hash_ids['axiom'].get(name)
+        if hash_id is None:
             raise KeyError("%s not found as an axiom in %s"
                            % (name, self.theory.name))
+        return hash_id
 
     def get_theorem_hash(self, name):
         '''
@@ -576,17 +638,20 @@ class TheoryStorage:
         folder).
         '''
         list(self._load_special_names('theorem'))
-        try:
-            return self._special_obj_hash_ids['theorem'][name]
-        except KeyError:
+        hash_id = self._special_obj_hash_ids['theorem'].get(name)
+        if hash_id is None:
             raise KeyError("%s not found as a theorem in %s"
                            % (name, self.theory.name))
+        return hash_id
 
     def get_common_expr(self, name):
         '''
         Return the Expression of the common expression in this theory
         with the given name.
         '''
+        expr = self._loadedCommonExprs.get(name)
+        if expr is not None:
+            return expr
         expr = self._getSpecialObject('common', name)
         self._loadedCommonExprs[name] = expr
         return expr
@@ -595,8 +660,9 @@ class TheoryStorage:
         '''
         Return the Axiom of the given name in this theory.
         '''
-        if name in self._loadedAxioms:
-            return self._loadedAxioms[name]
+        axiom = self._loadedAxioms.get(name)
+        if axiom is not None:
+            return axiom
         axiom = self._getSpecialObject('axiom', name)
         self._loadedAxioms[name] = axiom
         return axiom
@@ -605,8 +671,9 @@ class TheoryStorage:
         '''
         Return the Theorem of the given name in this theory.
         '''
-        if name in self._loadedTheorems:
-            return self._loadedTheorems[name]
+        thm = self._loadedTheorems.get(name)
+        if thm is not None:
+            return thm
         thm = self._getSpecialObject('theorem', name)
         self._loadedTheorems[name] = thm
         return thm
@@ -630,6 +697,9 @@ class TheoryStorage:
             special_expr_ids = self._special_expr_hash_ids[kind]
         if special_expr_ids is None:
             raise KeyError("%s of name '%s' not found" % (kind, name))
+        expr_id = self._kindname_to_exprhash.get((kind, name))
+        if expr_id is None:
+            raise KeyError("%s of name '%s' not found" % (kind, name))
 
         # set the default Theory in case there is a Literal
         prev_theory_default = Theory.default
@@ -642,8 +712,7 @@ class TheoryStorage:
                 # Don't allow anything to be imported from the folder
                 # that is currently being generated.
                 raise KeyError("Self importing is not allowed")
-            
-            expr_id = self._kindname_to_exprhash[(kind, name)]
+
             expr = theory_folder_storage.make_expression(expr_id)
 
             # make and return common expression, axiom, or theorem
@@ -776,9 +845,8 @@ class TheoryStorage:
             os.rename(stashed_version, proof_path)
             if os.path.isfile(filename):
                 return relurl(filename)
-        if not os.path.isdir(proof_path):
-            # make the directory for the proofs
-            os.makedirs(proof_path)
+        # make the directory for the proofs
+        os.makedirs(proof_path, exist_ok=True)
         # write the generic proof file
         with open(filename, 'w') as proof_notebook:
             proof_notebook.write(generic_nb_str)
@@ -827,12 +895,16 @@ class TheoryStorage:
                                    'proofs')
         if not os.path.isdir(proofs_path):
             return  # nothing to stash
-        for proof_folder in os.listdir(proofs_path):
-            if not os.path.isdir(os.path.join(proofs_path, proof_folder)):
-                continue  # disregard files, just directories
+        # Use scandir so the directory check comes from the cached
+        # directory entry rather than a separate stat call.
+        with os.scandir(proofs_path) as entries:
+            proof_dir_entries = [entry for entry in entries
+                                 if entry.is_dir()]
+        for entry in proof_dir_entries:
+            proof_folder = entry.name
             if proof_folder in theorem_names:
                 continue
-            proof_path = os.path.join(proofs_path, proof_folder)
+            proof_path = entry.path
 
             if "~stashed~" in proof_folder:
                 continue  # already a stashed notebook
@@ -909,13 +981,12 @@ class TheoryFolderStorage:
         self.pv_it_dir = self.theory_storage.pv_it_dir
         self.folder = folder
         self.path = os.path.join(self.pv_it_dir, folder)
-        if not os.path.isdir(self.path):
-            # make the folder
-            try:
-                os.makedirs(self.path)
-            except (OSError, FileExistsError):
-                # maybe another processor beat us to it.
-                pass
+        # make the folder if it doesn't exist yet
+        # (exist_ok in case another processor beats us to it).
+        try:
+            os.makedirs(self.path, exist_ok=True)
+        except OSError:
+            pass
 
         # For 'common', 'axioms', 'theorems' folders, we map
         # the object hash folder names to the name(s) of the
@@ -944,9 +1015,9 @@ class TheoryFolderStorage:
                     TheoryFolderStorage(theory_storage, 'dummy'))
             return TheoryFolderStorage.dummy_theory_folder_storage
         '''
-        if obj._style_id in proveit_obj_to_storage:
-            (theory_folder_storage, _) =\
-                proveit_obj_to_storage[obj._style_id]
+        storage_and_hash = proveit_obj_to_storage.get(obj._style_id)
+        if storage_and_hash is not None:
+            (theory_folder_storage, _) = storage_and_hash
             return theory_folder_storage
         else:
             # Return the "active theory folder storage" as default.
@@ -991,6 +1062,7 @@ class TheoryFolderStorage:
         # store the previous version.
         list(self.theory_storage._load_special_names(kind))
         self._prev_objhash_to_names = dict(self._objhash_to_names)
+        self.theory_storage._clear_theory_package_attrs()
         for names in self._objhash_to_names.values():
             for name in names:
                 self.theory_storage._kindname_to_exprhash.pop(
@@ -1005,7 +1077,7 @@ class TheoryFolderStorage:
             self.theory_storage._theorem_names = None
             self.theory_storage._loadedTheorems = dict()
         if folder == 'common':
-            self.theory_storage._common_exp_names = None
+            self.theory_storage._common_expr_names = None
             self.theory_storage._loadedCommonExprs = dict()
         self.theory_storage._special_expr_hash_ids[kind] = None
         self.theory_storage._special_obj_hash_ids[kind] = None
@@ -1253,14 +1325,13 @@ class TheoryFolderStorage:
                 # it may not have been completely erased before, but
                 # let's just use it.
                 break
-            with open(unique_rep_filename, 'r') as f:
-                rep = f.read()
-                if rep != unique_rep:
-                    # there is a hashing collision (this should be
-                    # astronomically rare, but we'll make sure just
-                    # in case)
-                    index += 1  # increment the index and try again
-                    continue
+            rep = _read_small_file(unique_rep_filename)
+            if rep != unique_rep:
+                # there is a hashing collision (this should be
+                # astronomically rare, but we'll make sure just
+                # in case)
+                index += 1  # increment the index and try again
+                continue
             # found a match; it is already in storage
             # remember this for next time
             result = (self, rep_hash + str(index))
@@ -1867,7 +1938,7 @@ class TheoryFolderStorage:
                     parent_module,
                     obj_name):
                 # reload the parent module and try again
-                imp.reload(parent_module)
+                importlib.reload(parent_module)
                 if (getattr(cur_module, obj_name) !=
                         getattr(parent_module, obj_name)):
                     break
@@ -2047,29 +2118,29 @@ class TheoryFolderStorage:
             exprid_to_storage[expr_id] = (theory_folder_storage,
                                           hash_directory)
             hash_path = self._storagePath(expr_id)
-            with open(os.path.join(hash_path, 'unique_rep.pv_it'), 'r') as f:
-                # Extract the unique representation from the pv_it file.
-                unique_rep = f.read()
-                # Parse the unique_rep to get the expression information.
-                (expr_class_str, core_info, style_dict, sub_expr_refs) = \
-                    Expression._parse_unique_rep(unique_rep)
-                if (local_theory_name is not None
-                        and expr_class_str.find(local_theory_name) == 0):
-                    # import locally if necessary
-                    expr_class_rel_strs[expr_id] = \
-                        expr_class_str[len(local_theory_name) + 1:]
-                expr_class_strs[expr_id] = expr_class_str
-                # extract the Expression "core information" from the
-                # unique representation
-                core_info_map[expr_id] = core_info
-                styles_map[expr_id] = style_dict
-                dependent_refs = sub_expr_refs
-                dependent_ids = \
-                    theory_folder_storage._extractReferencedStorageIds(
-                        unique_rep, storage_ids=dependent_refs)
-                sub_expr_ids_map[expr_id] = dependent_ids
-                #print('dependent_ids', dependent_ids)
-                return dependent_ids
+            # Extract the unique representation from the pv_it file.
+            unique_rep = _read_small_file(
+                os.path.join(hash_path, 'unique_rep.pv_it'))
+            # Parse the unique_rep to get the expression information.
+            (expr_class_str, core_info, style_dict, sub_expr_refs) = \
+                Expression._parse_unique_rep(unique_rep)
+            if (local_theory_name is not None
+                    and expr_class_str.find(local_theory_name) == 0):
+                # import locally if necessary
+                expr_class_rel_strs[expr_id] = \
+                    expr_class_str[len(local_theory_name) + 1:]
+            expr_class_strs[expr_id] = expr_class_str
+            # extract the Expression "core information" from the
+            # unique representation
+            core_info_map[expr_id] = core_info
+            styles_map[expr_id] = style_dict
+            dependent_refs = sub_expr_refs
+            dependent_ids = \
+                theory_folder_storage._extractReferencedStorageIds(
+                    unique_rep, storage_ids=dependent_refs)
+            sub_expr_ids_map[expr_id] = dependent_ids
+            #print('dependent_ids', dependent_ids)
+            return dependent_ids
 
         expr_ids = ordered_dependency_nodes(expr_id, get_dependent_expr_ids)
         for expr_id in reversed(expr_ids):
@@ -2124,9 +2195,9 @@ class TheoryFolderStorage:
             return theory_folder_storage.make_judgment_or_proof(storage_id)
         theory = self.theory
         hash_path = self._storagePath(storage_id)
-        with open(os.path.join(hash_path, 'unique_rep.pv_it'), 'r') as f:
-            # extract the unique representation from the pv_it file
-            unique_rep = f.read()
+        # extract the unique representation from the pv_it file
+        unique_rep = _read_small_file(
+            os.path.join(hash_path, 'unique_rep.pv_it'))
         subids = \
             theory_folder_storage._extractReferencedStorageIds(unique_rep)
 
@@ -2166,9 +2237,9 @@ class TheoryFolderStorage:
         theory = theory_folder_storage.theory
         folder = theory_folder_storage.folder
         hash_path = theory_folder_storage._storagePath(proof_id)
-        with open(os.path.join(hash_path, 'unique_rep.pv_it'), 'r') as f:
-            # extract the unique representation from the pv_it file
-            unique_rep = f.read()
+        # extract the unique representation from the pv_it file
+        unique_rep = _read_small_file(
+            os.path.join(hash_path, 'unique_rep.pv_it'))
         # full storage id:
         proof_id = theory.name + '.' + folder + '.' + hash_directory
         proveit_obj_to_storage = TheoryFolderStorage.proveit_object_to_storage
@@ -2185,7 +2256,7 @@ class TheoryFolderStorage:
                                                    'package_dependencies.txt')
         if os.path.isfile(referenced_commons_filename):
             with open(referenced_commons_filename, 'r') as f:
-                return {line.strip() for line in f.readlines()}
+                return {line.strip() for line in f}
         return set()  # empty set by default
 
     def clean(self, clear=False):
@@ -2427,8 +2498,7 @@ class StoredSpecialStmt:
                         remaining.append(line)
         # re-write file with all of the remaining lines
         with open(filepath, 'w') as f:
-            for line in remaining:
-                f.write(line + '\n')
+            f.writelines(line + '\n' for line in remaining)
 
     def _getEntries(self, filename):
         '''
@@ -2581,7 +2651,7 @@ class StoredTheorem(StoredSpecialStmt):
         presuming_file = os.path.join(self.path, 'presumed_theories.txt')
         if os.path.isfile(presuming_file):
             with open(presuming_file, 'r') as f:
-                for presumption in f.readlines():
+                for presumption in f:
                     presumption = presumption.strip()
                     if presumption == '': continue
                     presumptions.append(presumption)
@@ -2614,7 +2684,7 @@ class StoredTheorem(StoredSpecialStmt):
         presuming_file = os.path.join(self.path, 'presumed_theorems.txt')
         if os.path.isfile(presuming_file):
             with open(presuming_file, 'r') as f:
-                for presumption in f.readlines():
+                for presumption in f:
                     presumption = presumption.strip()
                     if presumption == '': continue
                     presumptions.append(presumption)
@@ -2682,7 +2752,7 @@ class StoredTheorem(StoredSpecialStmt):
                 with open(filename, 'w') as f:
                     pass
             with open(filename, 'r') as f:
-                for line in f.readlines():
+                for line in f:
                     presumptions.add(line.strip())
         return allowances, disallowances
 
@@ -2739,7 +2809,7 @@ class StoredTheorem(StoredSpecialStmt):
         top_header = StoredTheorem.PRESUMPTIONS_HEADER
         exclusions_header = StoredTheorem.PRESUMPTION_EXCLUSION_HEADER
         with open(presumptions_filename, 'r') as f:
-            for line in f.readlines():
+            for line in f:
                 line = line.strip()
                 if line[0] == '#':
                     if line == exclusions_header:
@@ -2845,8 +2915,9 @@ class StoredTheorem(StoredSpecialStmt):
                     (eliminated_theorem_names, 'eliminated_theorems.txt')):
                 with open(os.path.join(self.path, used_stmts_filename),
                           'w') as used_stmts_file:
-                    for used_stmt_name in sorted(used_stmt_names):
-                        used_stmts_file.write(str(used_stmt_name) + '\n')
+                    used_stmts_file.writelines(
+                        str(used_stmt_name) + '\n' for used_stmt_name
+                        in sorted(used_stmt_names))
 
         # If this proof is complete (all of the theorems that it uses
         # are complete) then  propagate this information to the theorems
@@ -16,6 +16,9 @@ class _MeaningData:
     def __init__(self, unique_id, unique_rep):
         self._unique_id = unique_id
         self._unique_rep = unique_rep
+        # Variables used by an Expression with this (labeled) meaning
+        # (created on demand).
+        self.used_vars = None
 
 
 class _StyleData:
@@ -32,6 +35,11 @@ class _StyleData:
     def __init__(self, unique_id, unique_rep):
         self._unique_id = unique_id
         self._unique_rep = unique_rep
+        # Formatted strings remembered by the formatting arguments
+        # (created on demand), valid for the recorded proofs at the
+        # given Judgment.proof_record_count.
+        self.formatted_cache = None
+        self.formatted_record_count = None
     
     def __hash__(self):
         return self._unique_id
@@ -255,7 +255,13 @@ class Defaults:
         and derive their side-effects.
         '''
         if attr == 'assumptions' and hasattr(self, attr):
-            value = OrderedSet(self.checked_assumptions(value), mutable=False)
+            if value is None:
+                value = self.assumptions
+            else:
+                # Check the assumptions and build the OrderedSet in a
+                # single pass (without an intermediate tuple).
+                value = OrderedSet(self._checked_assumptions(value),
+                                   mutable=False)
             if self.__dict__['assumptions'] == value:
                 return # Nothing has changed.
             # '_sorted_assumptions' are no longer valid.
@@ -2199,7 +2199,6 @@ class ExprRange(Expression):
         elif self.get_style('order', default_order) == 'decreasing':
             from proveit.numbers import Neg
             decreasing = True
-            print("we are decreasing")
         else:
             decreasing = False
 
@@ -2255,7 +2254,6 @@ class ExprRange(Expression):
 
         if old_shift is None:
             if decreasing:
-                print("correct!")
                 judgment = negated_shift_equivalence.instantiate(
                     {f: _f, a: new_shift, i: _i.operand, j: _j.operand, k: _k, l: _l})
             else:
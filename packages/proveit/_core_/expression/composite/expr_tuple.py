@@ -1,4 +1,6 @@
-from .composite import Composite
+from functools import lru_cache
+from .composite import (Composite, composite_expression,
+                        single_or_composite_expression)
 from proveit._core_.expression.expr import Expression, MakeNotImplemented
 from proveit._core_.defaults import defaults, USE_DEFAULTS
 from proveit._core_.expression.style_options import StyleOptions
@@ -18,13 +20,65 @@ class ExprTuple(Composite, Expression):
     n+4 elements.
     """
 
+    # The shared ExprTuple() with no entries and default styles.
+    _empty_expr_tuple = None
+
+    @staticmethod
+    def _clear_():
+        '''
+        Clear all references to Prove-It information under
+        the ExprTuple jurisdiction.
+        '''
+        ExprTuple._empty_expr_tuple = None
+
+    def __new__(cls, *expressions, styles=None, _shareable=True):
+        '''
+        An empty ExprTuple with default styles is made often (e.g.,
+        for no conditions); share one instance rather than making
+        a new one each time.
+        '''
+        if (_shareable and cls is ExprTuple and len(expressions) == 0
+                and styles is None
+                and ExprTuple._empty_expr_tuple is not None):
+            return ExprTuple._empty_expr_tuple
+        return object.__new__(cls)
+
+    def __getnewargs_ex__(self):
+        '''
+        Copies (shallow or deep) and unpickled ExprTuples are made
+        through __new__ without arguments and then given the state of
+        the original; they must be fresh instances rather than the
+        shared empty ExprTuple.
+        '''
+        return (), {'_shareable': False}
+
     def __init__(self, *expressions, styles=None):
         '''
         Initialize an ExprTuple from an iterable over Expression
         objects.
         '''
+        if self is ExprTuple._empty_expr_tuple:
+            # The shared empty ExprTuple is already initialized.
+            return
+        if all(isinstance(entry, Expression) for entry in expressions):
+            # Typically, the entries are all Expressions already and
+            # don't need any conversion.
+            entries = expressions
+        else:
+            entries = ExprTuple._converted_entries(expressions)
+        self._init_entries(tuple(entries), styles)
+        if (self.__class__ is ExprTuple and len(entries) == 0
+                and styles is None):
+            ExprTuple._empty_expr_tuple = self
+
+    @staticmethod
+    def _converted_entries(expressions):
+        '''
+        Return the list of entries for the given 'expressions',
+        extracting Expressions from Judgments and converting other
+        objects into Expressions as appropriate.
+        '''
         from proveit._core_ import Judgment
-        from .composite import single_or_composite_expression
         entries = []
         if isinstance(expressions, str):
             # We should check for strings in particular because this
@@ -39,11 +93,37 @@ class ExprTuple(Composite, Expression):
                 entry = single_or_composite_expression(entry)
             assert isinstance(entry, Expression)
             entries.append(entry)
-        self.entries = tuple(entries)
+        return entries
+
+    def _init_entries(self, entries, styles):
+        '''
+        Finish initializing the ExprTuple given a tuple of entries
+        that are known to be Expressions.
+        '''
+        self.entries = entries
+        # Flags indicating which entries are ExprRanges and the
+        # start/end indices of the ExprRanges (determined on demand;
+        # see _entry_range_flags and _entry_range_signature).
+        self._range_flags = None
+        self._range_signature = None
+        # Map from entries to their first index (made on demand
+        # by the 'index' method).
+        self._entry_index_map = None
 
         Expression.__init__(self, ['ExprTuple'], self.entries,
                             styles=styles)
 
+    @staticmethod
+    def _from_validated_entries(entries, styles=None):
+        '''
+        Make an ExprTuple from entries that are already known to be
+        Expressions (e.g., taken from other ExprTuples), skipping the
+        entry conversions and checks of __init__.
+        '''
+        expr_tuple = object.__new__(ExprTuple)
+        expr_tuple._init_entries(tuple(entries), styles)
+        return expr_tuple
+
     def style_options(self):
         options = StyleOptions(self)
         if len(self.entries) > 1:
@@ -78,7 +158,10 @@ class ExprTuple(Composite, Expression):
         if len(core_info) != 1 or core_info[0] != 'ExprTuple':
             raise ValueError("Expecting ExprTuple core_info to contain "
                              "exactly one item: 'ExprTuple'")
-        return ExprTuple(*sub_expressions, styles=styles)
+        # The sub-expressions are already Expressions, so skip the
+        # entry validation of __init__.
+        return ExprTuple._from_validated_entries(sub_expressions,
+                                                 styles=styles)
 
     def remake_arguments(self):
         '''
@@ -96,15 +179,13 @@ class ExprTuple(Composite, Expression):
         Operation class is to include appropriate 'with_wrapping_at'
         and 'with_justification' calls.
         '''
-        wrap_positions = self.wrap_positions()
-        call_strs = []
-        if len(wrap_positions) > 0:
-            call_strs.append('with_wrapping_at(' + ','.join(str(pos)
-                                                            for pos in wrap_positions) + ')')
+        if len(self.entries) < 2:
+            # No wrap positions without 2 or more entries.
+            wrap_positions_str = ''
+        else:
+            wrap_positions_str = self.get_style('wrap_positions', '')
         justification = self.get_style('justification', 'left')
-        if justification != 'left':
-            call_strs.append('with_justification("' + justification + '")')
-        return call_strs
+        return list(_style_calls(wrap_positions_str, justification))
 
     def __iter__(self):
         '''
@@ -115,7 +196,7 @@ class ExprTuple(Composite, Expression):
         return iter(self.entries)
 
     def __len__(self):
-        return self.num_entries()
+        return len(self.entries)
 
     def num_entries(self):
         '''
@@ -133,7 +214,7 @@ class ExprTuple(Composite, Expression):
         via ranges (ExprRange).
         '''
         if isinstance(idx, slice):
-            return ExprTuple(*self.entries[idx])
+            return ExprTuple._from_validated_entries(self.entries[idx])
         return self.entries[idx]
 
     def __add__(self, other):
@@ -143,7 +224,8 @@ class ExprTuple(Composite, Expression):
         of Expressions as the second argument.
         '''
         if isinstance(other, ExprTuple):
-            return ExprTuple(*(self.entries + other.entries))
+            return ExprTuple._from_validated_entries(
+                self.entries + other.entries)
         else:
             return ExprTuple(*(self.entries + tuple(other)))
 
@@ -164,15 +246,54 @@ class ExprTuple(Composite, Expression):
         '''
         Returns true if the entry contains an ExprRange.
         '''
-        from .expr_range import ExprRange
-        return any(isinstance(entry, ExprRange) for entry in self.entries)
+        return True in self._entry_range_flags()
+
+    def _entry_range_flags(self):
+        '''
+        Return a tuple of booleans, in correspondence with the
+        entries, indicating which entries are ExprRanges.  This is
+        determined once and remembered so loops over the entries
+        don't need to repeat the isinstance checks.
+        '''
+        range_flags = self._range_flags
+        if range_flags is None:
+            ExprRange = _expr_range_class()
+            range_flags = self._range_flags = tuple(
+                isinstance(entry, ExprRange) for entry in self.entries)
+        return range_flags
 
     def index(self, entry, start=0, stop=None):
+        if start == 0 and stop is None and isinstance(entry, Expression):
+            # Use a map from each entry to its first index, made on
+            # the first such call.
+            entry_index_map = self._entry_index_map
+            if entry_index_map is None:
+                entry_index_map = self._entry_index_map = dict()
+                for _k, _entry in enumerate(self.entries):
+                    entry_index_map.setdefault(_entry, _k)
+            if entry in entry_index_map:
+                return entry_index_map[entry]
         if stop is None:
             return self.entries.index(entry, start)
         else:
             return self.entries.index(entry, start, stop)
 
+    def _entry_range_signature(self):
+        '''
+        Return a tuple, in correspondence with the entries, of
+        (true_start_index, true_end_index) pairs for ExprRange entries
+        and None for other entries.  This is determined once and
+        remembered.  ExprTuples with equal signatures have matching
+        ranges (see has_matching_ranges).
+        '''
+        range_signature = self._range_signature
+        if range_signature is None:
+            range_signature = self._range_signature = tuple(
+                (entry.true_start_index, entry.true_end_index) if is_range
+                else None for entry, is_range in zip(
+                    self.entries, self._entry_range_flags()))
+        return range_signature
+
     def wrap_positions(self):
         '''
         Return a list of wrap positions according to the current style setting.
@@ -182,8 +303,8 @@ class ExprTuple(Composite, Expression):
             # There can be no "wrap positions" unless there are 2 or
             # more entries.
             return []
-        return [int(pos_str) for pos_str in self.get_style(
-            'wrap_positions', '').strip('()').split(' ') if pos_str != '']
+        return list(_parsed_wrap_positions(
+            self.get_style('wrap_positions', '')))
 
     def string(self, **kwargs):
         return self.formatted('string', **kwargs)
@@ -201,9 +322,40 @@ class ExprTuple(Composite, Expression):
             wrap_positions=None,
             justification=None,
             **kwargs):
-        from .expr_range import ExprRange
-
-        out_str = ''
+        '''
+        Format the ExprTuple as a 'string' or 'latex'.  The result is
+        remembered on the style data (shared by all ExprTuples with
+        the same style and meaning) for the given formatting
+        arguments so it won't need to be regenerated.
+        '''
+        operators_key = _formatting_operators_key(operator_or_operators)
+        if operators_key is None:
+            # Not something we know how to remember.
+            return self._formatted(
+                format_type, fence=fence, sub_fence=sub_fence,
+                operator_or_operators=operator_or_operators,
+                implicit_first_operator=implicit_first_operator,
+                wrap_positions=wrap_positions,
+                justification=justification)
+        key = (format_type, fence, sub_fence, operators_key,
+               implicit_first_operator,
+               None if wrap_positions is None else tuple(wrap_positions),
+               justification)
+        return self._remembered_formatted(
+            key, lambda: self._formatted(
+                format_type, fence=fence, sub_fence=sub_fence,
+                operator_or_operators=operator_or_operators,
+                implicit_first_operator=implicit_first_operator,
+                wrap_positions=wrap_positions,
+                justification=justification))
+
+    def _formatted(self, format_type, *, fence, sub_fence,
+                   operator_or_operators, implicit_first_operator,
+                   wrap_positions, justification):
+        '''
+        Helper for 'formatted' that generates the formatted string
+        without consulting the cache.
+        '''
         if len(self.entries) == 0 and fence:
             # for an empty list, show the parenthesis to show something.
             return '()'
@@ -212,78 +364,116 @@ class ExprTuple(Composite, Expression):
             # Convert from a convention where position 'n' is after the nth comma to one in which the position '2n' is
             # after the nth operator (which also allow for position before
             # operators).
-            wrap_positions = [2 * pos for pos in self.wrap_positions()]
+            if len(self.entries) < 2:
+                wrap_positions = ()
+            else:
+                wrap_positions = _doubled_wrap_positions(
+                    self.get_style('wrap_positions', ''))
         if justification is None:
             justification = self.get_style('justification', 'left')
 
         do_wrapping = len(wrap_positions) > 0
+        if (not do_wrapping and isinstance(operator_or_operators, str)
+                and True not in self._entry_range_flags()):
+            # The common case of a single operator (e.g., a comma)
+            # between regular entries without any wrapping.
+            return self._simply_formatted(
+                format_type, fence=fence, sub_fence=sub_fence,
+                operator=operator_or_operators,
+                implicit_first_operator=implicit_first_operator)
+        # Collect the pieces of the formatted string to join at the end.
+        parts = []
         if fence:
-            out_str = '(' if format_type == 'string' else r'\left('
+            parts.append('(' if format_type == 'string' else r'\left(')
         if do_wrapping and format_type == 'latex':
-            out_str += r'\begin{array}{%s} ' % justification[0]
+            parts.append(r'\begin{array}{%s} ' % justification[0])
 
+        num_entries = len(self.entries)
         if isinstance(operator_or_operators, list):
             operators = operator_or_operators
         elif isinstance(operator_or_operators, ExprTuple):
             operators = list(operator_or_operators.entries)
         else:
-            operators = [operator_or_operators]*self.num_entries()
-        if self.num_entries() == len(operators) + 1:
+            operators = [operator_or_operators]*num_entries
+        if num_entries == len(operators) + 1:
             # operators between operands -- put a blank 'operator' at
             # the beginning.
             operators = [''] + operators
-        if len(operators) != self.num_entries():
+        if len(operators) != num_entries:
             raise ValueError("There should be the same number of operators "
                              "as operands, or 1 less for them to appear "
                              "just between operands: "
                              "%s with %d vs %s with %d"%(
                                      operators, len(operators),
-                                     self.entries, self.num_entries()))
-        formatted_entries = [] # in (operator, element/ellipsis) pairs
+                                     self.entries, num_entries))
+        # Alternating formatted operators and operands
+        # (or ellipses for ranges).
+        pieces = []
+        append_piece = pieces.append
         implicit_operator = implicit_first_operator
-        for sub_expr, operator in zip(self, operators):
-            if isinstance(sub_expr, ExprRange):
-                formatted_entries += sub_expr._formatted_entries(
-                    format_type,
-                    implicit_first_operator=implicit_operator,
-                    operator_or_operators=operator)
+        for sub_expr, operator, is_range in zip(
+                self.entries, operators, self._entry_range_flags()):
+            if is_range:
+                for formatted_entry in sub_expr._formatted_entries(
+                        format_type,
+                        implicit_first_operator=implicit_operator,
+                        operator_or_operators=operator):
+                    pieces += formatted_entry
             else:
                 if implicit_operator:
                     operator = ''
                 elif isinstance(operator, Expression):
                     operator = operator.formatted(format_type)
-                if len(formatted_entries) > 0:
+                if len(pieces) > 0:
                     if operator not in (',', ';'):
                         operator = ' ' + operator
                     operator = operator + ' '
+                append_piece(operator)
                 if isinstance(sub_expr, ExprTuple):
                     # always fence nested expression lists
-                    formatted_entries.append(
-                        [operator, sub_expr.formatted(format_type,
-                                                      fence=True)])
+                    append_piece(sub_expr.formatted(format_type, fence=True))
                 else:
-                    formatted_entries.append(
-                        [operator, sub_expr.formatted(format_type,
-                                                      fence=sub_fence)])
+                    append_piece(sub_expr.formatted(format_type,
+                                                    fence=sub_fence))
             implicit_operator = False
 
-        # put the formatted operator between each of formatted_sub_expressions
+        # Wrap position 2n is after the nth operator (before its
+        # operand) and 2n+1 is after the nth operand, so each wrap
+        # position directly indexes the pieces.
         for wrap_position in wrap_positions:
-            if wrap_position % 2 == 1:
-                # wrap after operand (before next operation)
-                formatted_entries[(wrap_position - 1) // 2][1] += r' \\ '
-            else:
-                # wrap after operation (before next operand)
-                formatted_entries[wrap_position // 2][0] += r' \\ '
-        # The operators are
-        out_str += ''.join(''.join([operator, operand]) for
-                            operator, operand in formatted_entries)
+            pieces[wrap_position] += r' \\ '
+        parts += pieces
 
         if do_wrapping and format_type == 'latex':
-            out_str += r' \end{array}'
+            parts.append(r' \end{array}')
         if fence:
-            out_str += ')' if format_type == 'string' else r'\right)'
+            parts.append(')' if format_type == 'string' else r'\right)')
 
+        return ''.join(parts)
+
+    def _simply_formatted(self, format_type, *, fence, sub_fence,
+                          operator, implicit_first_operator):
+        '''
+        Helper for '_formatted' for the case of one string operator,
+        no ExprRange entries, and no wrapping.  This produces the same
+        result as the general case with less overhead.
+        '''
+        if operator in (',', ';'):
+            separator = operator + ' '
+        else:
+            separator = ' ' + operator + ' '
+        out_str = separator.join([
+            # always fence nested expression lists
+            entry.formatted(format_type, fence=True)
+            if isinstance(entry, ExprTuple) else
+            entry.formatted(format_type, fence=sub_fence)
+            for entry in self.entries])
+        if not implicit_first_operator and len(self.entries) > 0:
+            out_str = operator + out_str
+        if fence:
+            if format_type == 'string':
+                return '(' + out_str + ')'
+            return r'\left(' + out_str + r'\right)'
         return out_str
 
     def _auto_simplified_sub_exprs(
@@ -448,7 +638,7 @@ class ExprTuple(Composite, Expression):
         Expression.  This includes the extent of all contained ranges.
         If proven==True, a proof is constructed in the process.
         '''
-        from .expr_range import ExprRange
+        ExprRange = _expr_range_class()
         from proveit.core_expr_types import Len
         from proveit.numbers import Add, zero, one
         if proven:
@@ -469,10 +659,10 @@ class ExprTuple(Composite, Expression):
         canonical forms.  ExprRanges are shifted to start with an
         index of 1.
         '''
-        from .expr_range import ExprRange
+        ExprRange = _expr_range_class()
         entries = []
-        for entry in self.entries:
-            if isinstance(entry, ExprRange):
+        for entry, is_range in zip(self.entries, self._entry_range_flags()):
+            if is_range:
                 from proveit.numbers import (one, Add, Neg, 
                                              quick_simplified_index)
                 parameter = entry.parameter
@@ -508,11 +698,9 @@ class ExprTuple(Composite, Expression):
         whether it is parameter independent and, if not, the
         'parameterization' style option of the ExprRange.
         '''
-        from .expr_range import ExprRange
-
-        for item in self.entries:
+        for item, is_range in zip(self.entries, self._entry_range_flags()):
             # Append to cell entries.
-            if isinstance(item, ExprRange):
+            if is_range:
                 # An ExprRange covers multiple format cells.
                 for info in item.yield_format_cell_info():
                     yield info
@@ -536,16 +724,15 @@ class ExprTuple(Composite, Expression):
         The assumptions dictate simplifications that may apply to
         the element positions.
         '''
-        from .expr_range import ExprRange
         from proveit.numbers import Add, zero, one
 
         element_positions = []
         element_pos = zero # We will add 1 before using this.
-        for item in self.entries:
+        for item, is_range in zip(self.entries, self._entry_range_flags()):
             # Add one to the element_pos.
             element_pos = Add(element_pos, one).quick_simplified()
             # Append to element_positions.
-            if isinstance(item, ExprRange):
+            if is_range:
                 # An ExprRange covers multiple format cells.
                 element_pos = item._append_format_cell_element_positions(
                         element_pos, element_positions)
@@ -560,21 +747,14 @@ class ExprTuple(Composite, Expression):
         with respect to which entries are ExprRanges and, where they
         are, the start and end indices of the ExprRanges match.
         '''
-        from proveit import ExprRange, composite_expression
         if not isinstance(other_tuple, ExprTuple):
             other_tuple = composite_expression(other_tuple)
         if len(self.entries) != len(other_tuple):
             return False  # don't have the same number of entries
-        for entry, other_entry in zip(self, other_tuple):
-            if (isinstance(entry, ExprRange)
-                    != isinstance(other_entry, ExprRange)):
-                return False  # range vs singular mismatch
-            if isinstance(entry, ExprRange):
-                if entry.true_start_index != other_entry.true_start_index:
-                    return False  # start indices don't match
-                if entry.true_end_index != other_entry.true_end_index:
-                    return False  # end indices don't match
-        return True  # everything matches.
+        # Compare which entries are ranges and their start and end
+        # indices all at once.
+        return (self._entry_range_signature() ==
+                other_tuple._entry_range_signature())
 
     def basic_replaced(self, repl_map, *,
                        allow_relabeling=False, requirements=None):
@@ -593,23 +773,23 @@ class ExprTuple(Composite, Expression):
         For an entry that is an ExprRange, its "replaced entries" are
         embedded as one or more entries of the ExprTuple.
         '''
-        from .expr_range import ExprRange
         if len(repl_map) > 0 and (self in repl_map):
             # The full expression is to be replaced.
             return repl_map[self]
 
         subbed_entries = []
-        for entry in self.entries:
-            if isinstance(entry, ExprRange):
+        append_entry = subbed_entries.append
+        extend_entries = subbed_entries.extend
+        for entry, is_range in zip(self.entries, self._entry_range_flags()):
+            if is_range:
                 # ExprRange.replaced is a generator that yields items
                 # to be embedded into the tuple.
-                subbed_entries.extend(entry._replaced_entries(
+                extend_entries(entry._replaced_entries(
                     repl_map, allow_relabeling, requirements))
             else:
-                subbed_entry = entry.basic_replaced(
+                append_entry(entry.basic_replaced(
                         repl_map, allow_relabeling=allow_relabeling,
-                        requirements=requirements)
-                subbed_entries.append(subbed_entry)
+                        requirements=requirements))
 
         if (len(subbed_entries) == len(self.entries) and
                 all(subbed_entry._style_id == entry._style_id for
@@ -664,7 +844,7 @@ class ExprTuple(Composite, Expression):
         with all of its entries simplified (and ExprRanges reduced).
         '''
         from proveit.relation import TransRelUpdater
-        from proveit import ExprRange
+        ExprRange = _expr_range_class()
         expr = self
         eq = TransRelUpdater(expr)
         _k = 0
@@ -693,7 +873,7 @@ class ExprTuple(Composite, Expression):
         expressions.
         '''
         from proveit.relation import TransRelUpdater
-        from proveit import ExprRange
+        ExprRange = _expr_range_class()
         from proveit.logic import is_irreducible_value, EvaluationError
         expr = self
         eq = TransRelUpdater(expr)
@@ -807,7 +987,7 @@ class ExprTuple(Composite, Expression):
         self in an entrywise manner via readily provable equality.
         '''
         from proveit.logic import Equals
-        from .expr_range import ExprRange
+        ExprRange = _expr_range_class()
         if not isinstance(rhs, ExprTuple):
             return False
         if self.num_entries() != rhs.num_entries():
@@ -845,7 +1025,7 @@ class ExprTuple(Composite, Expression):
         equal or not.
         '''
         from proveit.logic import Or, Equals, NotEquals
-        from .expr_range import ExprRange
+        ExprRange = _expr_range_class()
         if not isinstance(rhs, ExprTuple):
             # rhs is not an ExprTuple but there is no guarantee that
             # it isn't something that represents and ExprTuple.
@@ -1078,7 +1258,7 @@ class ExprTuple(Composite, Expression):
     @equality_prover('equated', 'equate')
     def deduce_equal(self, rhs, *,
                      eq_via_elem_eq_thm=None, **defaults_config):
-        from proveit import ExprRange
+        ExprRange = _expr_range_class()
         from proveit import a, b, i
         from proveit.logic import Equals
         from proveit.core_expr_types.tuples import tuple_eq_via_elem_eq
@@ -1088,14 +1268,17 @@ class ExprTuple(Composite, Expression):
 
         # Handle the special counting cases.  For example,
         #   (1, 2, 3, 4) = (1, ..., 4)
+        # Check the cheap conditions on the rhs before building any
+        # numerals for the lhs.
         _n = len(self.entries)
-        if all(self[_k] == num(_k + 1) for _k in range(_n)):
-            if (isinstance(rhs, ExprTuple)
-                    and rhs.num_entries() == 1
-                    and isinstance(rhs[0], ExprRange)):
+        if (isinstance(rhs, ExprTuple)
+                and rhs.num_entries() == 1
+                and isinstance(rhs[0], ExprRange)
+                and rhs[0].true_start_index == one):
+            if all(entry == num(_k + 1) for _k, entry
+                   in enumerate(self.entries)):
                 expr_range = rhs[0]
-                if (expr_range.true_start_index == one and
-                        expr_range.true_end_index == num(_n)):
+                if expr_range.true_end_index == num(_n):
                     if len(self.entries) >= 10:
                         raise NotImplementedError("counting range equality "
                                                   "not implemented for more "
@@ -1189,7 +1372,7 @@ class ExprTuple(Composite, Expression):
                                           "map has not been implemented")
                 pass  # need the lambda map
             # Collapse singular items at the beginning.
-            front_singles = ExprTuple(eq.expr[:first_range_pos])
+            front_singles = eq.expr[:first_range_pos]
             i_sub = lambda_map.extract_argument(front_singles[0])
             j_sub = lambda_map.extract_argument(front_singles[-1])
             if len(front_singles.entries) == 2:
@@ -1261,7 +1444,7 @@ class ExprTuple(Composite, Expression):
             return eq.relation
 
         while eq.expr.num_entries() > 1:
-            front_merger = ExprTuple(*eq.expr[:2].entries).merger()
+            front_merger = eq.expr[:2].merger()
             eq.update(front_merger.substitution(
                 eq.expr.inner_expr()[:2]))
         return eq.relation
@@ -1488,7 +1671,7 @@ class ExprTuple(Composite, Expression):
                     "{0} has {1} entries.".format(self, self.num_entries))
 
         # and the single entry is an ExprRange:
-        from proveit import ExprRange
+        ExprRange = _expr_range_class()
         if not isinstance(self.entries[0], ExprRange):
             raise ValueError(
                     "ExprTuple.range_expansion() implemented only for "
@@ -1548,7 +1731,7 @@ class ExprTuple(Composite, Expression):
         
         See also ExprTuple.map_elements_together.
         '''
-        from proveit import ExprRange
+        ExprRange = _expr_range_class()
         mapped_entries = []
         for entry in self.entries:
             if isinstance(entry, ExprRange):
@@ -1624,7 +1807,7 @@ def is_single(expr_tuple):
     Return True if this has a single element that is not an
     ExprRange.
     '''
-    from .expr_range import ExprRange
+    ExprRange = _expr_range_class()
     return (len(expr_tuple.entries) == 1 and
                 not isinstance(expr_tuple[0], ExprRange))
 
@@ -1678,3 +1861,79 @@ class ConvertToMapError(Exception):
     def __str__(self):
         return ("The indices must be in correspondence with ExprTuple items "
                 "when performing ExprTuple.convert_to_map: %s" % self.extr_msg)
+
+
+_ExprRange = None
+
+
+def _expr_range_class():
+    '''
+    Return the ExprRange class.  It can't be imported at the top of
+    this module (expr_range imports ExprTuple), so it is imported the
+    first time it is needed and remembered thereafter.
+    '''
+    global _ExprRange
+    if _ExprRange is None:
+        from .expr_range import ExprRange
+        _ExprRange = ExprRange
+    return _ExprRange
+
+
+@lru_cache(maxsize=None)
+def _parsed_wrap_positions(wrap_positions_str):
+    '''
+    Return the tuple of wrap positions parsed from a 'wrap_positions'
+    style string such as '(1 3)'.  There are few distinct style
+    strings, so these are remembered.
+    '''
+    return tuple(int(pos_str) for pos_str in
+                 wrap_positions_str.strip('()').split(' ') if pos_str != '')
+
+
+@lru_cache(maxsize=None)
+def _doubled_wrap_positions(wrap_positions_str):
+    '''
+    Return the parsed wrap positions, doubled to follow the
+    ExprTuple.formatted convention in which position '2n' is after
+    the nth operator.
+    '''
+    return tuple(2 * pos for pos in
+                 _parsed_wrap_positions(wrap_positions_str))
+
+
+@lru_cache(maxsize=None)
+def _style_calls(wrap_positions_str, justification):
+    '''
+    Return the tuple of "with..." call strings for
+    ExprTuple.remake_with_style_calls given the 'wrap_positions'
+    and 'justification' styles.  These are remembered since the
+    same few style combinations recur for many ExprTuples.
+    '''
+    wrap_positions = _parsed_wrap_positions(wrap_positions_str)
+    call_strs = []
+    if len(wrap_positions) > 0:
+        call_strs.append('with_wrapping_at(' + ','.join(str(pos)
+                                                        for pos in wrap_positions) + ')')
+    if justification != 'left':
+        call_strs.append('with_justification("' + justification + '")')
+    return tuple(call_strs)
+
+
+def _formatting_operators_key(operator_or_operators):
+    '''
+    Return a hashable key representing the 'operator_or_operators'
+    argument of ExprTuple.formatted, or None if there isn't an
+    appropriate key.  Expressions are represented by their style id
+    since their formatting depends upon their style.
+    '''
+    if isinstance(operator_or_operators, str):
+        return operator_or_operators
+    if isinstance(operator_or_operators, Expression):
+        return ('expr', operator_or_operators._style_id)
+    if isinstance(operator_or_operators, list):
+        keys = tuple(_formatting_operators_key(operator) for operator
+                     in operator_or_operators)
+        if None in keys:
+            return None
+        return keys
+    return None
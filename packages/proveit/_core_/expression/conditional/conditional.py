@@ -1,6 +1,11 @@
+from weakref import WeakValueDictionary
+from proveit.util import OrderedSet
 from proveit.decorators import prover, equality_prover
-from proveit._core_.expression.expr import Expression, MakeNotImplemented
-from proveit._core_.expression.composite import is_single
+from proveit._core_.expression.expr import (
+    Expression, MakeNotImplemented, traverse_inner_expressions)
+from proveit._core_.expression.composite import (
+    is_single, single_or_composite_expression, Composite, ExprTuple)
+from proveit._core_.expression.style_options import StyleOptions
 from proveit._core_.defaults import defaults, USE_DEFAULTS
 
 class Conditional(Expression):
@@ -21,6 +26,19 @@ class Conditional(Expression):
     instances and the rest are disregarded.
     '''
 
+    # Conditionals remade via replacements, keyed by the style ids of
+    # their value and condition and by their style preferences, so the
+    # same (value, condition) pair is not reconstructed repeatedly.
+    _interned = WeakValueDictionary()
+
+    @staticmethod
+    def _clear_():
+        '''
+        Clear all references to Prove-It information under
+        the Conditional jurisdiction.
+        '''
+        Conditional._interned.clear()
+
     def __init__(self, value, condition_or_conditions, *, styles=None):
         '''
         Create a Conditional with the given particular value
@@ -30,8 +48,9 @@ class Conditional(Expression):
         the conditions will be displayed in a comma
         delimited fashion if it is within a conjunction.
         '''
-        from proveit._core_.expression.composite import \
-            single_or_composite_expression, Composite, ExprTuple, ExprRange
+        # ExprRange is imported here since expr_range imports this
+        # module.
+        from proveit._core_.expression.composite import ExprRange
 
         value = single_or_composite_expression(value)
         assert (isinstance(value, Expression)
@@ -80,19 +99,20 @@ class Conditional(Expression):
         yield self.value
         yield self.condition
 
+    # The style options of a Conditional do not depend upon the
+    # particular instance: (name, description, default, related_methods).
+    _style_option_specs = (
+        ('condition_delimiter', "'comma' or 'and'", 'comma',
+         ('with_comma_delimiter', 'with_conjunction_delimiter')),)
+
     def style_options(self):
         '''
         Return the StyleOptions for this Conditional.
         '''
-        from proveit import StyleOptions
         options = StyleOptions(self)
-        options.add_option(
-                name = 'condition_delimiter', 
-                description = ("'comma' or 'and'"),
-                default = 'comma',
-                related_methods = ('with_comma_delimiter',
-                                   'with_conjunction_delimiter')
-                )
+        for name, description, default, related_methods in (
+                Conditional._style_option_specs):
+            options.add_option(name, description, default, related_methods)
         return options
     
     def with_comma_delimiter(self):
@@ -102,6 +122,23 @@ class Conditional(Expression):
         return self.with_styles(condition_delimiter='and')
 
     def _formatted_condition(self, format_type, **kwargs):
+        '''
+        Return the formatted condition, remembered (when there are no
+        extra formatting arguments) according to the format type,
+        condition delimiter, and assumptions.
+        '''
+        if len(kwargs) > 0:
+            return self._generate_formatted_condition(format_type, **kwargs)
+        key = ('condition', format_type,
+               self.get_style('condition_delimiter'))
+        return self._remembered_formatted(
+            key, lambda: self._generate_formatted_condition(format_type))
+
+    def _generate_formatted_condition(self, format_type, **kwargs):
+        '''
+        Helper for '_formatted_condition' that generates the formatted
+        condition without consulting the cache.
+        '''
         from proveit.logic import And
         if self.get_style('condition_delimiter') == 'comma':
             if (isinstance(self.condition, And)
@@ -122,7 +159,9 @@ class Conditional(Expression):
             # Add the condition as an assumption when formatting the
             # value.
             temp_defaults.automation = False
-            temp_defaults.assumptions = defaults.assumptions + (self.condition,)
+            if self.condition not in defaults.assumptions:
+                temp_defaults.assumptions = (defaults.assumptions +
+                                             (self.condition,))
             formatted_value = self.value.formatted(format_type, **kwargs)
         if format_type == "string":
             formatted_condition = self._formatted_condition('string', **kwargs)
@@ -159,22 +198,76 @@ class Conditional(Expression):
 
         value = self.value
         condition = self.condition
+        repl_vars = _replacement_vars(repl_map)
+        (value_vars, value_has_range,
+         cond_vars, cond_has_range) = self._replacement_screening()
 
-        # First perform substitution on the conditions:
-        subbed_cond = condition.basic_replaced(
-                repl_map, allow_relabeling=allow_relabeling,
-                requirements=requirements)
+        # First perform substitution on the conditions (unless the
+        # replacements cannot affect it):
+        if (repl_vars is not None and not cond_has_range
+                and repl_vars.isdisjoint(cond_vars)):
+            subbed_cond = condition
+        else:
+            subbed_cond = condition.basic_replaced(
+                    repl_map, allow_relabeling=allow_relabeling,
+                    requirements=requirements)
 
         # Next perform substitution on the value, adding the condition
         # as an assumption.
-        with defaults.temporary() as temp_defaults:
-            temp_defaults.assumptions = defaults.assumptions + (subbed_cond,)
-            subbed_val = value.basic_replaced(
-                    repl_map, allow_relabeling=allow_relabeling,
-                    requirements=requirements)
+        if (repl_vars is not None and not value_has_range
+                and repl_vars.isdisjoint(value_vars)):
+            subbed_val = value
+        else:
+            with defaults.temporary() as temp_defaults:
+                if subbed_cond not in defaults.assumptions:
+                    temp_defaults.assumptions = (defaults.assumptions +
+                                                 (subbed_cond,))
+                subbed_val = value.basic_replaced(
+                        repl_map, allow_relabeling=allow_relabeling,
+                        requirements=requirements)
+
+        if (subbed_val._style_id == value._style_id and
+                subbed_cond._style_id == condition._style_id):
+            # Nothing change, so don't remake anything.
+            return self
+        return Conditional._interned_conditional(
+            subbed_val, subbed_cond, self._style_data.styles)
 
-        return Conditional(subbed_val, subbed_cond,
-                           styles=self._style_data.styles)
+    def _replacement_screening(self):
+        '''
+        Return the used variables of the value, whether the value
+        contains an ExprRange, the used variables of the condition,
+        and whether the condition contains an ExprRange.  This is used
+        to skip replacements that cannot affect the value or
+        condition.  ExprRanges are never skipped since their indices
+        may be simplified when they are replaced.  Computed on demand
+        and remembered.
+        '''
+        if not hasattr(self, '_replacement_screening_info'):
+            from proveit._core_.expression.composite import ExprRange
+            info = []
+            for sub_expr in (self.value, self.condition):
+                info.append(sub_expr._used_vars())
+                info.append(any(isinstance(inner_expr, ExprRange) for
+                                inner_expr in
+                                traverse_inner_expressions(sub_expr)))
+            self._replacement_screening_info = tuple(info)
+        return self._replacement_screening_info
+
+    @staticmethod
+    def _interned_conditional(value, condition, styles):
+        '''
+        Return a Conditional with the given value, condition, and
+        style preferences, reusing a previously made one when
+        possible.
+        '''
+        key = (value._style_id, condition._style_id,
+               None if styles is None else frozenset(styles.items()))
+        conditional = Conditional._interned.get(key)
+        if conditional is None:
+            conditional = Conditional(value, condition, styles=styles)
+            Conditional._interned[key] = conditional
+        return conditional
 
     def _auto_simplified_sub_exprs(self, *, requirements, stored_replacements,
                                    markers_and_marked_expr):
@@ -195,8 +288,8 @@ class Conditional(Expression):
                 subbed_cond._style_id == self.condition._style_id):
             # Nothing change, so don't remake anything.
             return self
-        return Conditional(subbed_val, subbed_cond,
-                           styles=self._style_data.styles)        
+        return Conditional._interned_conditional(
+            subbed_val, subbed_cond, self._style_data.styles)
 
     def _equality_replaced_sub_exprs(self, recursion_fn, *, requirements, 
                                      stored_replacements):
@@ -220,12 +313,15 @@ class Conditional(Expression):
         
         # For each condition, we'll assume the previous substituted
         # conditions.
+        # The inner assumptions are extended one condition at a time
+        # rather than rebuilt from all previous conditions each time.
         subbed_conds = []
         prev_assumptions = defaults.assumptions
         inner_stored_repls = stored_replacements
+        inner_assumptions = OrderedSet(defaults.assumptions)
         for _k, cond in enumerate(conditions):
-            inner_assumptions = (defaults.assumptions 
-                                 + tuple(subbed_conds))
+            if _k > 0:
+                inner_assumptions.add(subbed_conds[-1])
             with defaults.temporary() as temp_defaults:
                 temp_defaults.assumptions = inner_assumptions
                 if defaults.assumptions != prev_assumptions:
@@ -238,7 +334,8 @@ class Conditional(Expression):
                                      build_get_cond_fn(_k)))
     
         # For the value, we'll assume all of the substituted conditions.
-        inner_assumptions = (defaults.assumptions  + tuple(subbed_conds))
+        if len(subbed_conds) > 0:
+            inner_assumptions.add(subbed_conds[-1])
         with defaults.temporary() as temp_defaults:
             temp_defaults.assumptions = inner_assumptions
             if defaults.assumptions != prev_assumptions:
@@ -561,3 +658,26 @@ class Conditional(Expression):
         raise NotImplementedError("Conditional.deduce_equal only implemented "
                                   "for equating Conditionals with the same "
                                   "condition.")
+
+
+def _replacement_vars(repl_map):
+    '''
+    Return the set of Variables used by the keys of the replacement map
+    (repl_map), or None if the Variables cannot be used to rule out
+    replacements.  That is the case if some key uses no Variables
+    (e.g., a Literal) or if some key is or contains a Lambda or an
+    ExprRange, whose parameters may be relabeled to match
+    sub-expressions that use different Variables.
+    '''
+    from proveit._core_.expression.lambda_expr import Lambda
+    from proveit._core_.expression.composite import ExprRange
+    repl_vars = set()
+    for key in repl_map.keys():
+        key_vars = key._used_vars()
+        if len(key_vars) == 0:
+            return None
+        if any(isinstance(inner_expr, (Lambda, ExprRange)) for inner_expr
+               in traverse_inner_expressions(key)):
+            return None
+        repl_vars.update(key_vars)
+    return repl_vars
@@ -619,6 +619,9 @@ class Expression(metaclass=ExprType):
         return str(self)  # just use the string representation
 
     def __eq__(self, other):
+        if self is other:
+            # The same object; no need to compare ids.
+            return True
         if isinstance(other, Expression):
             if self._labeled_meaning_id == other._labeled_meaning_id:
                 # Equal in a strong sense -- not only the same meaning
@@ -633,7 +636,12 @@ class Expression(metaclass=ExprType):
         return not self.__eq__(other)
 
     def __hash__(self):
-        return self._establish_and_get_meaning_id()
+        # The meaning id is stored once established; only establish it
+        # (via a method call) the first time.
+        try:
+            return self._meaning_id
+        except AttributeError:
+            return self._establish_and_get_meaning_id()
 
     def __str__(self):
         '''
@@ -671,6 +679,40 @@ class Expression(metaclass=ExprType):
         if format_type == 'latex':
             return self.latex(**kwargs)
 
+    def _remembered_formatted(self, key, generate):
+        '''
+        Return a formatted string of this expression, remembered on
+        the style data (shared by all expressions with the same style
+        and meaning) according to the given key, which should account
+        for the format type and any formatting arguments.  The
+        'generate' function is called to produce the string when it
+        is not remembered.  The formatting of an ExprRange can depend
+        upon the assumptions and upon what has been proven, so the
+        assumptions are part of the key and remembered strings are
+        forgotten whenever a new proof is recorded.  If the key is not
+        hashable (e.g., an unhashable formatting argument), the string
+        is generated without being remembered.
+        '''
+        from proveit._core_.judgment import Judgment
+        record_count = Judgment.proof_record_count
+        key = (key, defaults.sorted_assumptions)
+        try:
+            hash(key)
+        except TypeError:
+            return generate()
+        style_data = self._style_data
+        formatted_cache = style_data.formatted_cache
+        if (formatted_cache is None or
+                style_data.formatted_record_count != record_count):
+            formatted_cache = style_data.formatted_cache = dict()
+            style_data.formatted_record_count = record_count
+        elif key in formatted_cache:
+            return formatted_cache[key]
+        out_str = generate()
+        if Judgment.proof_record_count == record_count:
+            formatted_cache[key] = out_str
+        return out_str
+
     @classmethod
     def _make(cls, core_info, sub_expressions, *, styles, 
               canonically_labeled=None):
@@ -1668,9 +1710,15 @@ class Expression(metaclass=ExprType):
         Return all of the used Variables of this Expression,
         included those in sub-expressions.
         Call externally via the used_vars method in expr.py.
+        These only depend upon the labeled meaning of the Expression,
+        so they are computed once and remembered (as a frozenset) in
+        the labeled meaning data.
         '''
-        return set().union(*[expr._used_vars() for
-                             expr in self._sub_expressions])
+        meaning_data = self._labeled_meaning_data
+        if meaning_data.used_vars is None:
+            meaning_data.used_vars = frozenset().union(
+                *[expr._used_vars() for expr in self._sub_expressions])
+        return meaning_data.used_vars
 
     def _contained_parameter_vars(self):
         '''
@@ -1947,8 +1995,10 @@ def used_vars(expr):
     '''
     Return all of the used Variables of this Expression,
     included those in sub-expressions.
+    Returns a new set, so the caller may freely alter it (the
+    frozenset remembered by Expression._used_vars is not exposed).
     '''
-    return expr._used_vars()
+    return set(expr._used_vars())
 
 def contained_parameter_vars(expr):
     '''
@@ -40,6 +40,7 @@ class _ExprProofs:
         assert isinstance(newproof, Proof)
         assert newproof.proven_truth.expr == self._expr
         self._proofs.add(newproof)
+        Judgment.proof_record_count += 1
 
     def discard(self, oldproof):
         from .proof import Proof
@@ -101,6 +102,12 @@ class Judgment:
     # something is proven.
     in_progress_to_derive_sideeffects = set()
 
+    # Incremented whenever the record of usable proofs changes (a proof
+    # is recorded or disabled, a theorem proof begins, or everything is
+    # cleared) so that anything remembered about what can or cannot be
+    # proven may be invalidated.
+    proof_record_count = 0
+
     @staticmethod
     def _clear_():
         '''
@@ -118,6 +125,7 @@ class Judgment:
         Judgment.presumed_theorems_and_dependencies = None
         Judgment.qed_in_progress = False
         _ExprProofs.all_expr_proofs.clear()
+        Judgment.proof_record_count += 1
         assert len(Judgment.in_progress_to_derive_sideeffects) == 0, (
                 "Unexpected remnant 'in_progress_to_derive_sideeffects' "
                 "items (should have been temporary)")
@@ -324,6 +332,7 @@ class Judgment:
         Judgment.disallowed_theorems_and_theories = disallowed
         Judgment.presumed_theorems_and_dependencies = set()
         Theorem.update_usability()
+        Judgment.proof_record_count += 1
 
         # change Judgment.has_been_proven
         # from None to False -- we can now test to see if
@@ -512,6 +512,7 @@ class Proof:
         their dependencies or revising them to use alternate
         proofs if available.
         '''
+        Judgment.proof_record_count += 1
         # Disable in an order sorted according to the number
         # of steps so that dependents are visited after
         # everything they depend upon and we avoid revising
@@ -1513,8 +1514,6 @@ class Deduction(Proof):
         try:
             implication_expr = Implies(antecedent_expr, consequent_truth.expr)
             num_lit_gen = consequent_truth.num_lit_gen
-            if num_lit_gen > 0:
-                print("Instantiation with lit gen")
             implication_truth = Judgment(implication_expr, assumptions,
                                          num_lit_gen=num_lit_gen)
             self.consequent_truth = consequent_truth
@@ -27,6 +27,26 @@ from ._theory_storage import TheoryStorage, TheoryFolderStorage, relurl
 from types import ModuleType
 
 
+# Directories known to contain an __init__.py file.
+_dirs_with_init_file = set()
+
+
+def _has_init_file(directory):
+    '''
+    Return True iff the directory contains an __init__.py file.
+    Positive results are remembered since theory directories share
+    ancestors that would otherwise be probed again for each new
+    Theory.  Negative results are not remembered since an
+    __init__.py file may be added later.
+    '''
+    if directory in _dirs_with_init_file:
+        return True
+    if os.path.isfile(os.path.join(directory, '__init__.py')):
+        _dirs_with_init_file.add(directory)
+        return True
+    return False
+
+
 class Theory:
     '''
     A Theory object provides an interface into the __pv_it database for access
@@ -49,9 +69,13 @@ class Theory:
     default = None
 
     # Track the storage object associated with each theory and folder,
-    # mapped by the absolute path.
+    # mapped by the canonical path (see _canonical_path).
     storages = dict()
 
+    # Map absolute paths given to the Theory constructor to the
+    # normalized path of the theory directory they resolve to.
+    _resolved_paths = dict()
+
     special_expr_kind_to_module_name = {
         'common': '_common_',
         'axiom': '_axioms_',
@@ -66,6 +90,8 @@ class Theory:
         Theory._rootTheoryPaths.clear()
         Theory.default = None
         Theory.storages.clear()
+        Theory._resolved_paths.clear()
+        _dirs_with_init_file.clear()
         TheoryFolderStorage.active_theory_folder_storage = None
         TheoryFolderStorage.proveit_object_to_storage.clear()
         TheoryFolderStorage.owned_hash_folders.clear()
@@ -84,59 +110,64 @@ class Theory:
                 path)
 
         path = os.path.abspath(path)
+        # Reuse the resolution of a previously encountered path to
+        # avoid repeating the path adjustments and file probes.
+        normpath = Theory._resolved_paths.get(path)
+        if normpath is None or normpath not in Theory.storages:
+            normpath = self._resolve_storage(path)
+            Theory._resolved_paths[path] = normpath
+        self._storage = Theory.storages[normpath]
+        if active_folder is not None:
+            self.set_active_folder(active_folder, owns_active_folder)
+        self.name = self._storage.name
+
+    def _resolve_storage(self, path):
+        '''
+        Find the theory directory for the given absolute path,
+        creating the TheoryStorage for it if necessary.  Return the
+        normalized path which keys the storage in Theory.storages.
+        '''
+        # The path is already absolute and normalized, so we can
+        # go up directory levels by simply truncating its components.
         # If in a __pv_it_ directory, go to the containing theory
         # directory.
         splitpath = path.split(os.path.sep)
         if '__pv_it' in splitpath:
             pv_it_idx = splitpath.index('__pv_it')
-            num_up_levels = (len(splitpath) - pv_it_idx)
-            # if num_up_levels > 1:
+            # if pv_it_idx+1 < len(splitpath):
             #    active_folder = splitpath[pv_it_idx+1]
-            path = os.path.abspath(os.path.join(
-                *([path] + ['..'] * num_up_levels)))
+            splitpath = splitpath[:pv_it_idx]
         # If in a _theory_nbs_ directory, go to the 
         # containing theory directory.
-        splitpath = path.split(os.path.sep)
         if '_theory_nbs_' in splitpath:
             nbs_idx = splitpath.index('_theory_nbs_')
-            num_up_levels = (len(splitpath) - nbs_idx)
-            path = os.path.abspath(os.path.join(
-                *([path] + ['..'] * num_up_levels)))
+            splitpath = splitpath[:nbs_idx]
+        path = os.path.sep.join(splitpath)
 
         # move the path up to the directory level, not script file level
         if path[-3:] == '.py' or path[-4:] == '.pyc':
             path, _ = os.path.split(path)
 
-        # Makes the case be consistent in operating systems (i.e. Windows)
-        # with a case insensitive filesystem:
-        normpath = os.path.normcase(path)
+        normpath = Theory._canonical_path(path)
 
         if normpath in Theory.storages:
             # got the storage - we're good
-            self._storage = Theory.storages[normpath]
-            self.name = self._storage.name
-            if active_folder is not None:
-                self.set_active_folder(active_folder, owns_active_folder)
-            return
+            return normpath
 
         if os.path.isfile(
                 path):  # just in case checking for '.py' or '.pyc' wasn't sufficient
             path, _ = os.path.split(path)
-            normpath = os.path.normcase(path)
+            normpath = Theory._canonical_path(path)
 
         if normpath in Theory.storages:
             # got the storage - we're good
-            self._storage = Theory.storages[normpath]
-            self.name = self._storage.name
-            if active_folder is not None:
-                self.set_active_folder(active_folder, owns_active_folder)
-            return
+            return normpath
 
         # the name of the theory is based upon the directory, going
         # up the tree as long as there is an __init__.py file.
         name = ''
         remaining_path = path
-        while os.path.isfile(os.path.join(remaining_path, '__init__.py')):
+        while _has_init_file(remaining_path):
             remaining_path, tail = os.path.split(remaining_path)
             name = tail if name == '' else (tail + '.' + name)
         # the root theory tracks paths to external packages
@@ -149,13 +180,9 @@ class Theory:
         if '.' in name:
             root_directory = os.path.join(remaining_path, name.split('.')[0])
         # Create the Storage object for this Theory
-        if normpath not in Theory.storages:
-            Theory.storages[normpath] = TheoryStorage(
-                self, name, path, root_directory)
-        self._storage = Theory.storages[normpath]
-        if active_folder is not None:
-            self.set_active_folder(active_folder, owns_active_folder)
-        self.name = self._storage.name
+        Theory.storages[normpath] = TheoryStorage(
+            self, name, path, root_directory)
+        return normpath
 
     def __eq__(self, other):
         return self._storage is other._storage
@@ -179,10 +206,13 @@ class Theory:
     def links(self, from_directory='.'):
         theory_name_segments = self._storage.name.split('.')
         theory_html_segments = []
+        directory = self._storage.directory
+        up_level = os.pardir + os.sep
+        num_segments = len(theory_name_segments)
         for k, theory_name_segment in enumerate(theory_name_segments):
-            path = os.path.join(*([self._storage.directory] +
-                                  ['..'] * (len(theory_name_segments) - k - 1) +
-                                  ['_theory_nbs_', 'theory.ipynb']))
+            path = os.path.join(directory,
+                                up_level * (num_segments - k - 1) +
+                                '_theory_nbs_', 'theory.ipynb')
             url_link = relurl(path, start=from_directory)
             theory_html_segments.append(
                 r'<a class=\"ProveItLink\" href=\"%s\">%s</a>' %
@@ -202,12 +232,23 @@ class Theory:
         '''
         return self._storage.directory
 
+    @staticmethod
+    def _canonical_path(path):
+        '''
+        Return the absolute, normalized form of the path that is used
+        to compare theory directories and key Theory.storages.  The
+        case is made consistent for operating systems (i.e. Windows)
+        with a case insensitive filesystem.
+        '''
+        return os.path.normcase(os.path.abspath(path))
+
     @staticmethod
     def _setRootTheoryPath(theory_name, path):
-        path = os.path.normpath(os.path.abspath(path))
+        path = os.path.abspath(path)
         if theory_name in Theory._rootTheoryPaths:
             stored_path = Theory._rootTheoryPaths[theory_name]
-            if os.path.normcase(stored_path) != os.path.normcase(path):
+            if (Theory._canonical_path(stored_path) !=
+                    Theory._canonical_path(path)):
                 raise TheoryException(
                     "Conflicting directory references to theory '%s': %s vs %s" % (theory_name,
                                                                                    path,
@@ -258,13 +299,13 @@ class Theory:
             theorem_definitions, 'theorem')
 
     def _clear_axioms(self):
-        self._setAxioms([], dict())
+        self._set_axioms(OrderedDict())
 
     def _clear_theorems(self):
-        self._setTheorems([], dict())
+        self._set_theorems(OrderedDict())
 
-    def _clear_common_exressions(self):
-        self._set_common_expressions([], dict(), clear=True)
+    def _clear_common_expressions(self):
+        self._set_common_expressions(OrderedDict())
 
     def _set_common_expressions(self, expr_definitions):
         if not isinstance(expr_definitions, OrderedDict):
@@ -620,12 +661,25 @@ class TheoryPackage(ModuleType):
         self._theory = Theory(filename)
         self.__file__ = filename
         self.__dict__.update(attr_dict)
+        # Names of common expressions, axioms, and theorems that
+        # __getattr__ has stored as attributes of this module.
+        self._cached_attr_names = set()
     
     def __dir__(self):
         expression_axiom_and_theorems_names = \
             self._theory.get_expression_axiom_and_theorem_names()
-        return sorted(list(self.__dict__.keys()) + 
-                      list(expression_axiom_and_theorems_names))
+        return sorted(set(self.__dict__.keys()).union(
+            expression_axiom_and_theorems_names))
+
+    def _clear_cached_attrs(self):
+        '''
+        Forget the common expressions, axioms, and theorems stored as
+        attributes by __getattr__ so they will be retrieved again
+        (e.g., after the theory notebooks are re-executed).
+        '''
+        for name in self._cached_attr_names:
+            self.__dict__.pop(name, None)
+        self._cached_attr_names.clear()
     
     def __getattr__(self, name):
         '''
@@ -634,6 +688,8 @@ class TheoryPackage(ModuleType):
         common expression notebook is currently runninng, assume
         the missing name is a common expression that hasn't been
         defined yet and return an UnsetCommonExpressionPlaceholder.
+        Anything that is found is stored as an attribute of this
+        module so subsequent accesses bypass __getattr__.
         '''
         if name[0:2]=='__': 
             # don't handle internal Python attributes
@@ -647,9 +703,23 @@ class TheoryPackage(ModuleType):
             kind = 'common'
 
         if kind == 'axiom':
-            return self._theory.get_axiom(name).proven_truth
+            value = self._theory.get_axiom(name).proven_truth
         elif kind == 'theorem':
-            return self._theory.get_theorem(name).proven_truth
+            value = self._theory.get_theorem(name).proven_truth
+        else:
+            value = self._get_common_expr_or_placeholder(name)
+            if isinstance(value, UnsetCommonExpressionPlaceholder):
+                return value  # placeholders are not stored
+        self.__dict__[name] = value
+        self._cached_attr_names.add(name)
+        return value
+
+    def _get_common_expr_or_placeholder(self, name):
+        '''
+        Return the common expression of the given name, or an
+        UnsetCommonExpressionPlaceholder if it is not found while
+        executing a common expression notebook.
+        '''
         try:
             return self._theory.get_common_expr(name)
         except (KeyError, OSError, TheoryException):
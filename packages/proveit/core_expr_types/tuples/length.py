@@ -1,3 +1,4 @@
+from weakref import WeakValueDictionary
 from proveit import (Expression, Lambda, Operation, Literal, safe_dummy_var,
                      single_or_composite_expression, ExprTuple,
                      ExprRange, InnerExpr, defaults,
@@ -9,6 +10,13 @@ class Len(Operation):
     # operator of the Length operation.
     _operator_ = Literal(string_format='length', theory=__file__)
 
+    # Map (Len style id and expression, defaults state) to the
+    # Judgment produced by 'computation' or 'typical_eq' so repeated
+    # requests are not recomputed.  Entries disappear along with their
+    # Judgments.
+    _computation_cache = WeakValueDictionary()
+    _typical_eq_cache = WeakValueDictionary()
+
     def __init__(self, operands, *, styles=None):
         '''
         Len can take an explicit ExprTuple as operands, or
@@ -48,6 +56,19 @@ class Len(Operation):
         In the last case, the 'x' represents an unknown tuple,
         so there is not anything we can do to compute it.
         '''
+        cache_key = self._defaults_cache_key()
+        cached = Len._computation_cache.get(cache_key)
+        if cached is not None and cached.is_usable():
+            return cached
+        len_comp = self._computation()
+        Len._computation_cache[cache_key] = len_comp
+        return len_comp
+
+    def _computation(self):
+        '''
+        Helper for 'computation' that does the actual work (without
+        consulting the cache).
+        '''
         # Currently not doing anything with must_evaluate
         # What it should do is make sure it evaluates to a number
         # and can circumvent any attempt that will not evaluate to
@@ -61,9 +82,14 @@ class Len(Operation):
             from proveit.logic import Equals
             return Equals(self, self).conclude_via_reflexivity()
         entries = self.operands.entries
+        # Classify the entries once to select the appropriate case.
+        num_entries = len(entries)
         has_range = any(isinstance(entry, ExprRange) for entry in entries)
-        if (len(entries) == 1 and has_range
-                and not isinstance(entries[0].body, ExprRange)):
+        # Is the first entry an ExprRange that is not nested?
+        first_is_simple_range = (
+            has_range and isinstance(entries[0], ExprRange)
+            and not isinstance(entries[0].body, ExprRange))
+        if num_entries == 1 and first_is_simple_range:
             # Compute the length of a single range.  Examples:
             # |(f(1), ..., f(n))| = n
             # |(f(i), ..., f(j))| = j-i+1
@@ -81,25 +107,20 @@ class Len(Operation):
                     {f: lambda_map, i: start_index, j: end_index}, auto_simplify=False)
         elif not has_range:
             # Case of all non-range entries.
-            if len(entries) == 0:
+            if num_entries == 0:
                 # zero length.
                 from proveit.core_expr_types.tuples import tuple_len_0
                 return tuple_len_0
-            elif len(entries) < 10:
+            elif num_entries < 10:
                 # Automatically get the count and equality with
                 # the length of the proper iteration starting from
                 # 1.  For example,
                 # |(a, b, c)| = 3
                 # |(a, b, c)| = |(1, .., 3)|
-                import proveit.numbers.numerals.decimals
-                _n = len(entries)
-                len_thm = proveit.numbers.numerals.decimals\
-                    .__getattr__('tuple_len_%d' % _n)
-                repl_map = dict()
-                for param, entry in zip(len_thm.explicit_instance_params(),
-                                        entries):
-                    repl_map[param] = entry
-                return len_thm.instantiate(repl_map, auto_simplify=False)
+                len_thm, params = _tuple_len_thm_and_params(
+                    'tuple_len_%d', num_entries)
+                return len_thm.instantiate(dict(zip(params, entries)),
+                                           auto_simplify=False)
             else:
                 # raise NotImplementedError("Can't handle length computation "
                 #                        ">= 10 for %s"%self)
@@ -112,18 +133,17 @@ class Len(Operation):
                 # Since we know it's true, why not commit ourselves to 
                 # proving it?
                 return tuple_len_incr.instantiate(
-                    {i: num(len(entries) - 1), a: entries[:-1], b: entries[-1]},
+                    {i: num(num_entries - 1), a: entries[:-1], b: entries[-1]},
                     automation=True)
                 # return Equals(eq.lhs, eq.rhs._integerBinaryEval(assumptions=assumptions).rhs).prove(assumptions=assumptions)
                 # raise NotImplementedError("Can't handle length computation "
                 #                         ">= 10 for %s"%self)
-        elif (len(entries) == 2 and not isinstance(entries[1], ExprRange)
-                and not isinstance(entries[0].body, ExprRange)):
+        elif (num_entries == 2 and first_is_simple_range
+                and not isinstance(entries[1], ExprRange)):
             # Case of an extended range:
             # |(a_1, ..., a_n, b| = n+1
             from proveit.core_expr_types.tuples import \
                 extended_range_len, extended_range_from1_len
-            assert isinstance(entries[0], ExprRange)
             range_lambda = entries[0].lambda_map
             range_start = entries[0].true_start_index
             range_end = entries[0].true_end_index
@@ -146,84 +166,82 @@ class Len(Operation):
             _x = safe_dummy_var(self)
             preserved_exprs = defaults.preserved_exprs
 
-            def entry_map(entry):
-                # Don't auto-simplify the entry.
-                preserved_exprs.add(entry)
-                if isinstance(entry, ExprRange):
-                    if isinstance(entry.body, ExprRange):
-                        # Return an ExprRange of lambda maps.
-                        return ExprRange(entry.parameter,
-                                         entry.body.lambda_map,
-                                         entry.true_start_index,
-                                         entry.true_end_index)
-                    else:
-                        return entry.lambda_map
-                # For individual elements, just map to the
-                # elemental entry.
-                return Lambda(_x, entry)
-
-            def entry_start(entry):
-                if isinstance(entry, ExprRange):
-                    if isinstance(entry.body, ExprRange):
-                        # Return an ExprRange of lambda maps.
-                        return ExprRange(entry.parameter,
-                                         entry.body.true_start_index,
-                                         entry.true_start_index,
-                                         entry.true_end_index)
-                    else:
-                        return entry.true_start_index
-                return one  # for individual elements, use start=end=1
-
-            def entry_end(entry):
-                if isinstance(entry, ExprRange):
-                    if isinstance(entry.body, ExprRange):
-                        # Return an ExprRange of lambda maps.
-                        return ExprRange(entry.parameter,
-                                         entry.body.true_end_index,
-                                         entry.true_start_index,
-                                         entry.true_end_index)
-                    else:
-                        return entry.true_end_index
-                return one  # for individual elements, use start=end=1
-
-            def empty_range(_i, _j, _f):
-                # If the start and end are literal ints and form an
-                # empty range, then it should be straightforward to
-                # prove that the range is empty.
-                from proveit.numbers import is_numeric_int, Add
-                from proveit.logic import Equals
-                from proveit import m
-                _m = entries[0].true_start_index
-                _n = entries[0].true_end_index
-                empty_req = Equals(Add(_n, one), _m)
-                if is_numeric_int(_m) and is_numeric_int(_n):
-                    if _n.as_int() + 1 == _m.as_int():
-                        empty_req.prove()
-                if empty_req.proven():
-                    _f = Lambda(
-                        (entries[0].parameter,
-                         entries[0].body.parameter),
-                        entries[0].body.body)
-                    _i = entry_map(_i)
-                    _j = entry_map(_j)
+            from proveit.numbers import is_numeric_int
+            if num_entries == 1:
+                # A single range of ranges (a single range that is not
+                # nested was handled above).  If the start and end are
+                # literal ints and form an empty range, then it should
+                # be straightforward to prove that the range is empty.
+                # Check this before building anything for the general
+                # case.
+                range_entry = entries[0]
+                _m = range_entry.true_start_index
+                _n = range_entry.true_end_index
+                if (is_numeric_int(_m) and is_numeric_int(_n) and
+                        _n.as_int() + 1 == _m.as_int()):
+                    from proveit.numbers import Add
+                    from proveit.logic import Equals
+                    from proveit import m
+                    parameter = range_entry.parameter
+                    body = range_entry.body
+                    # Don't auto-simplify the entry or the index ranges.
+                    preserved_exprs.add(range_entry)
+                    preserved_exprs.add(ExprRange(
+                        parameter, body.true_start_index, _m, _n))
+                    preserved_exprs.add(ExprRange(
+                        parameter, body.true_end_index, _m, _n))
+                    Equals(Add(_n, one), _m).prove()
+                    _f = Lambda((parameter, body.parameter), body.body)
+                    _i = Lambda(parameter, body.true_start_index)
+                    _j = Lambda(parameter, body.true_end_index)
                     return len_of_empty_range_of_ranges.instantiate(
                         {m: _m, n: _n, f: _f, i: _i, j: _j}).with_wrapping_at()
 
-            _f = [entry_map(entry) for entry in entries]
-            _i = [entry_start(entry) for entry in entries]
-            _j = [entry_end(entry) for entry in entries]
+            # Build _f, _i, and _j in a single pass over the entries,
+            # keeping track of whether the indices are all repeated.
+            _f = []
+            _i = []
+            _j = []
+            repeated_indices = True
+            # Don't auto-simplify the entries.
+            preserved_exprs.update(entries)
+            for entry in entries:
+                if isinstance(entry, ExprRange):
+                    body = entry.body
+                    start_index = entry.true_start_index
+                    end_index = entry.true_end_index
+                    if isinstance(body, ExprRange):
+                        # Use ExprRanges of lambda maps and indices.
+                        parameter = entry.parameter
+                        _f.append(ExprRange(parameter, body.lambda_map,
+                                            start_index, end_index))
+                        _i.append(ExprRange(parameter,
+                                            body.true_start_index,
+                                            start_index, end_index))
+                        _j.append(ExprRange(parameter,
+                                            body.true_end_index,
+                                            start_index, end_index))
+                    else:
+                        _f.append(entry.lambda_map)
+                        _i.append(start_index)
+                        _j.append(end_index)
+                else:
+                    # For individual elements, just map to the
+                    # elemental entry and use start=end=1.
+                    _f.append(Lambda(_x, entry))
+                    _i.append(one)
+                    _j.append(one)
+                if repeated_indices:
+                    # Check identity first; the indices are often the
+                    # very same expressions (e.g., 'one').
+                    start_index, end_index = _i[-1], _j[-1]
+                    if not ((start_index is _i[0] or start_index == _i[0])
+                            and (end_index is _j[0] or end_index == _j[0])):
+                        repeated_indices = False
             _n = Len(_i).computed()
 
-            from proveit.numbers import is_numeric_int
-            if len(entries) == 1 and isinstance(entries[0], ExprRange):
-                if (is_numeric_int(entries[0].true_start_index) and 
-                        is_numeric_int(entries[0].true_end_index)):
-                    if (entries[0].true_end_index.as_int() + 1 
-                            == entries[0].true_start_index.as_int()):
-                        return empty_range(_i[0], _j[0], _f)
-
             len_comp = None
-            if all(_ == _i[0] for _ in _i) and all(_ == _j[0] for _ in _j):
+            if repeated_indices:
                 if isinstance(_i[0], ExprRange):
                     if _i[0].is_parameter_independent:
                         # A parameter independent range means they
@@ -276,6 +294,19 @@ class Len(Operation):
         These are typically useful equalities for proving matching
         length requirements when instantiating a range of parameters.
         '''
+        cache_key = self._defaults_cache_key()
+        cached = Len._typical_eq_cache.get(cache_key)
+        if cached is not None and cached.is_usable():
+            return cached
+        eq = self._typical_eq()
+        Len._typical_eq_cache[cache_key] = eq
+        return eq
+
+    def _typical_eq(self):
+        '''
+        Helper for 'typical_eq' that does the actual work (without
+        consulting the cache).
+        '''
         from proveit.numbers import one
         if not isinstance(self.operands, ExprTuple):
             raise ValueError("Len.typical_eq may only be performed "
@@ -283,8 +314,14 @@ class Len(Operation):
                              % self)
 
         entries = self.operands.entries
-        if (len(entries) == 1 and isinstance(entries[0], ExprRange) and
-                not isinstance(entries[0].body, ExprRange)):
+        # Classify the entries once to select the appropriate case.
+        num_entries = len(entries)
+        has_range = any(isinstance(entry, ExprRange) for entry in entries)
+        # Is the first entry an ExprRange that is not nested?
+        first_is_simple_range = (
+            has_range and isinstance(entries[0], ExprRange)
+            and not isinstance(entries[0].body, ExprRange))
+        if num_entries == 1 and first_is_simple_range:
             # Treat the special case something of the form
             # |(f(i), ..., f(j))}.  For example:
             # |(f(i), ..., f(j)| = (i, ..., j)
@@ -303,32 +340,26 @@ class Len(Operation):
                 return range_len_typical_eq.instantiate(
                     {f: lambda_map, i: start_index, j: end_index},
                     auto_simplify=False)
-        elif not any(isinstance(entry, ExprRange) for entry in entries):
-            if len(entries) == 0:
+        elif not has_range:
+            if num_entries == 0:
                 from proveit.core_expr_types.tuples import \
                     tuple_len_0_typical_eq
                 return tuple_len_0_typical_eq
-            elif len(entries) < 10:
+            elif num_entries < 10:
                 # Get a "typical equality" for the case when there
                 # are no ExprRange's.  For example,
                 # |(a, b, c)| = |(1, .., 3)|
-                import proveit.numbers.numerals.decimals
-                n = len(entries)
-                eq_thm = proveit.numbers.numerals.decimals\
-                                .__getattr__('tuple_len_%d_typical_eq' % n)
-                repl_map = dict()
-                for param, entry in zip(eq_thm.explicit_instance_params(),
-                                        entries):
-                    repl_map[param] = entry
-                return eq_thm.instantiate(repl_map, auto_simplify=False)
-        elif (len(entries) == 2 and not isinstance(entries[1], ExprRange)
-                and not isinstance(entries[0].body, ExprRange)):
+                eq_thm, params = _tuple_len_thm_and_params(
+                    'tuple_len_%d_typical_eq', num_entries)
+                return eq_thm.instantiate(dict(zip(params, entries)),
+                                          auto_simplify=False)
+        elif (num_entries == 2 and first_is_simple_range
+                and not isinstance(entries[1], ExprRange)):
             # Case of an extended range:
             # |(a_1, ..., a_n, b| = |(1, ..., n_1)|
             from proveit.core_expr_types.tuples import \
                 (extended_range_len_typical_eq,
                  extended_range_from1_len_typical_eq)
-            assert isinstance(entries[0], ExprRange)
             range_lambda = entries[0].lambda_map
             range_start = entries[0].true_start_index
             range_end = entries[0].true_end_index
@@ -344,6 +375,18 @@ class Len(Operation):
                                   "this case: %s.  Try Len.deduce_equal "
                                   "instead." % self)
 
+    def _defaults_cache_key(self):
+        '''
+        Return a key for caching 'computation' or 'typical_eq'
+        results that accounts for the style of this Len and the
+        'defaults' that affect them.  This must be made before any
+        work is done since the work may add to the preserved
+        expressions of the defaults.
+        '''
+        return (self._style_id, self, defaults.sorted_assumptions, defaults.auto_simplify,
+                defaults.preserve_all, defaults.replacements,
+                frozenset(defaults.preserved_exprs))
+
     def readily_equal(self, rhs):
         '''
         ToDo: treat some simple cases as readily provable.
@@ -357,6 +400,9 @@ class Len(Operation):
         '''
         from proveit.logic import Equals
         equality = Equals(self, rhs)
+        if rhs == self:
+            # Trivial reflection; no need to compute anything.
+            return equality.conclude_via_reflexivity()
         if equality.proven():
             return equality.prove() # Already proven.
         lhs = self
@@ -466,3 +512,26 @@ class Len(Operation):
         InSet(computation.rhs, number_set).prove()
         return InSet(self, number_set).prove()
 
+
+# Map (theorem name pattern, number of entries) to the corresponding
+# 'tuple_len_%d' or 'tuple_len_%d_typical_eq' theorem of
+# proveit.numbers.numerals.decimals along with its explicit instance
+# parameters.  Populated lazily.
+_tuple_len_thms_and_params = dict()
+
+
+def _tuple_len_thm_and_params(name_pattern, num_entries):
+    '''
+    Return the 'tuple_len_%d' or 'tuple_len_%d_typical_eq' theorem
+    (according to name_pattern) for the given number of entries
+    (less than 10), along with its explicit instance parameters.
+    '''
+    key = (name_pattern, num_entries)
+    thm_and_params = _tuple_len_thms_and_params.get(key)
+    if thm_and_params is None:
+        import proveit.numbers.numerals.decimals
+        thm = proveit.numbers.numerals.decimals.__getattr__(
+            name_pattern % num_entries)
+        thm_and_params = (thm, tuple(thm.explicit_instance_params()))
+        _tuple_len_thms_and_params[key] = thm_and_params
+    return thm_and_params
@@ -1,9 +1,82 @@
+import sys
 import functools
-from inspect import signature, Parameter
+from weakref import WeakValueDictionary
+from inspect import (signature, Parameter, unwrap, 
+                     CO_VARARGS, CO_VARKEYWORDS)
 from proveit._core_.defaults import defaults
 from proveit.util import OrderedSet
 
-def _make_decorated_prover(func, automatic=False):
+# Classes used by the decorated provers.  These are imported on first
+# use (importing them when this module is loaded would be circular).
+_Expression = _Judgment = _InnerExpr = _Assumption = None
+_ExprRange = _ExprTuple = _Relation = None
+
+def _import_prover_classes():
+    '''
+    Import the classes used by the decorated provers and bind them to
+    module-level names so they need not be imported with every call.
+    '''
+    global _Expression, _Judgment, _InnerExpr, _Assumption
+    global _ExprRange, _ExprTuple, _Relation
+    from proveit import Expression, Judgment, InnerExpr
+    from proveit._core_.proof import Assumption
+    from proveit._core_.expression.composite import ExprRange, ExprTuple
+    from proveit.relation import Relation
+    _Expression, _Judgment, _InnerExpr = Expression, Judgment, InnerExpr
+    _Assumption = Assumption
+    _ExprRange, _ExprTuple, _Relation = ExprRange, ExprTuple, Relation
+
+def _public_attributes_dict(obj):
+    '''
+    Return a dictionary of public attributes and values of an object.
+    '''
+    return {key:val for key, val in obj.__dict__.items() 
+            if key[0] != '_'}
+
+def _checked_truth(func, proven_truth, is_conclude_method):
+    '''
+    Check that the proven_truth returned by the prover method, func,
+    is a Judgment and has appropriate assumptions.
+    '''
+    if proven_truth is None and is_conclude_method:
+        return proven_truth # we'll raise an exception later.
+    if not isinstance(proven_truth, _Judgment):
+        raise TypeError("@prover method %s is expected to return "
+                        "a proven Judgment, not %s of type %s."
+                        %(func, proven_truth, proven_truth.__class__))
+    if not proven_truth.is_applicable():
+        raise TypeError("@prover method %s returned a Judgment, "
+                        "%s, that is not proven under the active "
+                        "assumptions: %s"
+                        %(func, proven_truth, defaults.assumptions)) 
+    return proven_truth
+
+def _parameter_names(func):
+    '''
+    Return the parameter names of the given function along with the
+    name of its variable keyword parameter (or None if there is none).
+    The function's code object is read directly as this is much cheaper
+    than inspect.signature (and is done for each of the many decorated
+    provers as they are imported).
+    '''
+    code = getattr(unwrap(func), '__code__', None)
+    if code is None:
+        # Not a plain Python function; fall back to the signature.
+        params = signature(func).parameters
+        var_keyword_names = [name for name, param in params.items()
+                             if param.kind == Parameter.VAR_KEYWORD]
+        return (tuple(params), 
+                var_keyword_names[0] if var_keyword_names else None)
+    flags = code.co_flags
+    num_params = code.co_argcount + code.co_kwonlyargcount
+    if flags & CO_VARARGS:
+        num_params += 1
+    if flags & CO_VARKEYWORDS:
+        return (code.co_varnames[:num_params+1], 
+                code.co_varnames[num_params])
+    return code.co_varnames[:num_params], None
+
+def _make_decorated_prover(func, automatic=False, is_relation_prover=False):
     '''
     Use for decorating 'prover' methods 
     (@prover, @relation_prover, or @equality_prover).
@@ -12,23 +85,86 @@ def _make_decorated_prover(func, automatic=False):
     defaults.assumptions) before calling the decorated method.
     It will then check to see if the return type is a Judgment that is
     valid under "active" assumptions.
+
+    If is_relation_prover is True (for @relation_prover or
+    @equality_prover), also check that the Judgment is for a Relation.
+    Furthermore, unless alter_lhs=True is set in the keyword arguments
+    when the method is called, automatically 'preserve' the 'self'
+    expression and make sure it is on the left side of the returned
+    Relation Judgment.  This is done within the same wrapper (rather
+    than wrapping the @prover wrapper) to avoid an extra call layer.
     '''
-    sig = signature(func)
-    if ('defaults_config' not in sig.parameters or
-            sig.parameters['defaults_config'].kind != Parameter.VAR_KEYWORD):
-        raise Exception("As a @prover or any @..._prover method, the final "
+    param_names, var_keyword_name = _parameter_names(func)
+    if var_keyword_name != 'defaults_config':
+        raise TypeError("As a @prover or any @..._prover method, the final "
                         "parameter of %s must be a keyword argument called "
                         "'defaults_config' to signify that it accepts "
                         "keyword arguments for temporarily re-configuring "
                         "attributes of proveit.defaults "
                         "('assumptions', 'styles', etc.)"%func)
     
+    # Determine these once, at decoration time, rather than with
+    # every call.
+    param_names = frozenset(param_names)
     is_conclude_method = func.__name__.startswith('conclude')
+    is_conclude_negation_method = func.__name__.startswith(
+        'conclude_negation')
+    # The fast path (below) applies to plain, non-automatic provers.
+    allow_fast_path = not (automatic or is_conclude_method or
+                           is_relation_prover)
 
     def decorated_prover(*args, **kwargs):
-        from proveit import Expression, Judgment, InnerExpr
-        from proveit._core_.proof import Assumption
-        from proveit.logic import Equals
+        if _Judgment is None:
+            _import_prover_classes()
+        Expression, Judgment, InnerExpr = _Expression, _Judgment, _InnerExpr
+        Assumption = _Assumption
+
+        if (allow_fast_path and len(kwargs) == 0
+                and len(args) > 0 and not isinstance(args[0], Judgment)
+                and not isinstance(args[0], InnerExpr)):
+            # Fast path for the common case of no keyword arguments
+            # (so no defaults to change) on an Expression, etc. (not
+            # a Judgment or InnerExpr).
+            internal_kwargs = _public_attributes_dict(defaults)
+            # Make sure we derive assumption side-effects first.
+            Assumption.make_assumptions()
+            # Now call the prover function.
+            return _checked_truth(
+                func, func(*args, **internal_kwargs), is_conclude_method)
+
+        if is_relation_prover:
+            # 'preserve' the 'self' or 'self.expr' expression so it will 
+            # be on the left side without simplification.
+            _self = args[0]
+            if isinstance(_self, Expression):
+                relation_expr = _self
+            elif hasattr(_self, 'expr'):
+                relation_expr = _self.expr
+            else:
+                raise TypeError("@relation_prover, %s, expected to be a "
+                                "method for an Expression type or it must "
+                                "have an 'expr' attribute."%func)
+            alter_lhs = kwargs.pop('alter_lhs', False)
+            if not alter_lhs:
+                if automatic:
+                    kwargs['preserve_lhs'] = True
+                else:
+                    # preserve the left side.
+                    if 'preserve_expr' in kwargs:
+                        # Only copy the preserved expressions when the
+                        # left side is not already among them.
+                        if 'preserved_exprs' in kwargs:
+                            preserved_exprs = kwargs['preserved_exprs']
+                            if relation_expr not in preserved_exprs:
+                                kwargs['preserved_exprs'] = (
+                                    preserved_exprs.union([relation_expr]))
+                        elif relation_expr not in defaults.preserved_exprs:
+                            kwargs['preserved_exprs'] = (
+                                defaults.preserved_exprs.union(
+                                    [relation_expr]))
+                    else:
+                        kwargs['preserve_expr'] = relation_expr
+
         if (kwargs.get('preserve_all', False) and 
                 len(kwargs.get('replacements', tuple())) > 0):
             raise ValueError(
@@ -43,7 +179,10 @@ def _make_decorated_prover(func, automatic=False):
                 _assumptions = kwargs.get('assumptions', None)
                 if _assumptions is None:
                     _assumptions = defaults.assumptions
-                if not _self.assumptions.issubset(_assumptions):
+                self_assumptions = _self.assumptions
+                if (len(self_assumptions) > 0
+                        and self_assumptions is not _assumptions
+                        and not self_assumptions.issubset(_assumptions)):
                     _assumptions = OrderedSet(_assumptions, mutable=False)
                     kwargs['assumptions'] = _assumptions + _self.assumptions
             if is_conclude_method:
@@ -54,29 +193,24 @@ def _make_decorated_prover(func, automatic=False):
                     preserve_expr = _self.expr
                 else:
                     preserve_expr = _self
-        defaults_to_change = set(kwargs.keys()).intersection(
-                defaults.__dict__.keys())
-        if 'automation' in kwargs.keys():
+        defaults_dict = defaults.__dict__
+        defaults_to_change = {key for key in kwargs if key in defaults_dict}
+        if 'automation' in kwargs:
             # While 'automation' isn't a defaults key, it can be set
             # to set 'sideeffect_automation' and 'conclude_automation'.
             defaults_to_change.add('automation')
         # Check to see if there are any unexpected keyword
         # arguments.
-        for key in kwargs.keys():
+        for key in kwargs:
             if key in defaults_to_change: continue
-            if key not in sig.parameters:
+            if key not in param_names:
                 raise TypeError(
                         "%s got an unexpected keyword argument '%s' which "
                         "is not an attribute of proveit.defaults"%
                         (func, key))
-        def public_attributes_dict(obj):
-            # Return a dictionary of public attributes and values of
-            # an object.
-            return {key:val for key, val in obj.__dict__.items() 
-                    if key[0] != '_'}
-
         exprs_to_replace = set()
         if 'replacements' in kwargs:
+            from proveit.logic import Equals
             for replacement in kwargs['replacements']:
                 if not isinstance(replacement, Judgment):
                     raise TypeError("The 'replacements' must be Judgments")
@@ -102,32 +236,20 @@ def _make_decorated_prover(func, automatic=False):
                 raise ValueError(
                     "Cannot simultaneously replace and preserve %s"
                     %preserve_expr)
-            # Preserve the 'preserve_expr'.
+            # Preserve the 'preserve_expr' (unless it already is).
             if ('preserved_exprs' in defaults_to_change
                     or  preserve_expr not in defaults.preserved_exprs):
                 if 'preserved_exprs' in kwargs:
-                    kwargs['preserved_exprs'].add(preserve_expr)
+                    if preserve_expr not in kwargs['preserved_exprs']:
+                        # Copy rather than altering the caller's set.
+                        kwargs['preserved_exprs'] = (
+                            kwargs['preserved_exprs'].union(
+                                {preserve_expr}))
                 else:
                     defaults_to_change.add('preserved_exprs')
                     kwargs['preserved_exprs'] = (
                             defaults.preserved_exprs.union({preserve_expr}))
 
-        def checked_truth(proven_truth):
-            # Check that the proven_truth is a Judgment and has
-            # appropriate assumptions.
-            if proven_truth is None and is_conclude_method:
-                return proven_truth # we'll raise an exception later.
-            if not isinstance(proven_truth, Judgment):
-                raise TypeError("@prover method %s is expected to return "
-                                "a proven Judgment, not %s of type %s."
-                                %(func, proven_truth, proven_truth.__class__))
-            if not proven_truth.is_applicable():
-                raise TypeError("@prover method %s returned a Judgment, "
-                                "%s, that is not proven under the active "
-                                "assumptions: %s"
-                                %(func, proven_truth, defaults.assumptions)) 
-            return proven_truth
-
         if (automatic and not defaults.preserve_all) or (
                 len(defaults_to_change) > 0):
             # Temporarily reconfigure defaults
@@ -146,19 +268,21 @@ def _make_decorated_prover(func, automatic=False):
                     temp_defaults.preserve_all=True
                     temp_defaults.preserved_exprs = set()
                 internal_kwargs = dict(kwargs)
-                internal_kwargs.update(public_attributes_dict(defaults))
+                internal_kwargs.update(_public_attributes_dict(defaults))
                 # Make sure we derive assumption side-effects first.
                 Assumption.make_assumptions()
                 # Now call the prover function.
-                proven_truth = checked_truth(func(*args, **internal_kwargs))
+                proven_truth = _checked_truth(
+                    func, func(*args, **internal_kwargs), is_conclude_method)
         else:
             # No defaults reconfiguration.
             internal_kwargs = dict(kwargs)
-            internal_kwargs.update(public_attributes_dict(defaults))
+            internal_kwargs.update(_public_attributes_dict(defaults))
             # Make sure we derive assumption side-effects first.
             Assumption.make_assumptions()
             # Now call the prover function.
-            proven_truth = checked_truth(func(*args, **internal_kwargs))
+            proven_truth = _checked_truth(
+                func, func(*args, **internal_kwargs), is_conclude_method)
 
         if automatic and not defaults.preserve_all:
             # Temporarily reconfigure defaults
@@ -210,7 +334,7 @@ def _make_decorated_prover(func, automatic=False):
                 raise ValueError("@prover method %s is not implemented "
                                  "for %s."
                                 %(func, expr))
-            if func.__name__.startswith('conclude_negation'):
+            if is_conclude_negation_method:
                 from proveit.logic import Not
                 not_expr = Not(expr)
                 if proven_truth.expr != not_expr:
@@ -219,93 +343,48 @@ def _make_decorated_prover(func, automatic=False):
                             "'conclude_negation' must prove %s "
                             "but got %s."%(func, not_expr, proven_truth))   
                 # Match the style of not_self.
-                return proven_truth.with_matching_style(not_expr)
+                proven_truth = proven_truth.with_matching_style(not_expr)
             else:
                 if proven_truth.expr != expr:
                     raise ValueError("@prover method %s whose name starts with "
                                      "'conclude' must prove %s but got "
                                      "%s."%(func, expr, proven_truth))
                 # Match the style of self.
-                return proven_truth.with_matching_style(expr)
-        return proven_truth
-    return decorated_prover    
-
-def _make_decorated_relation_prover(func, automatic=False):
-    '''
-    Use for decorating 'relation_prover' methods 
-    (@relation_prover or @equality_prover).  In addition
-    to the @prover capabilities, temporarily altering 'defaults' and
-    checking that a Judgment is returned check that the
-    Judgment is for a Relation.  Furthermore, unless alter_lhs=True 
-    is set in the keyword arguments when the method is called,
-    automatically 'preserve' the 'self' expression and make sure it
-    is on the left side of the returned Relation Judgment.
-    '''
+                proven_truth = proven_truth.with_matching_style(expr)
 
-    decorated_prover = _make_decorated_prover(func, 
-                                              automatic=automatic)
-    
-    def decorated_relation_prover(*args, **kwargs):
-        from proveit._core_.expression.expr import Expression
-        from proveit._core_.expression.composite import ExprRange, ExprTuple
-        from proveit.relation import Relation  
-        
-        # 'preserve' the 'self' or 'self.expr' expression so it will 
-        # be on the left side without simplification.
-        _self = args[0]
-        if isinstance(_self, Expression):
-            expr = _self
-        elif hasattr(_self, 'expr'):
-            expr = _self.expr
-        else:
-            raise TypeError("@relation_prover, %s, expected to be a "
-                            "method for an Expression type or it must "
-                            "have an 'expr' attribute."%func)
-        alter_lhs = kwargs.pop('alter_lhs', False)
-        if not alter_lhs:
-            if automatic:
-                kwargs['preserve_lhs'] = True
-            else:
-                # preserve the left side.
-                if 'preserve_expr' in kwargs:
-                    if 'preserved_exprs' in kwargs:
-                        kwargs['preserved_exprs'] = (
-                            kwargs['preserved_exprs'].union([expr]))
-                    else:
-                        kwargs['preserved_exprs'] = (
-                            defaults.preserved_exprs.union([expr]))
-                else:
-                    kwargs['preserve_expr'] = expr
-        
-        # Use the regular @prover wrapper.
-        proven_truth = decorated_prover(*args, **kwargs)
-        
-        # Check that the result is of the expected form.
-        proven_expr = proven_truth.expr
-        if not isinstance(proven_expr, Relation):
-            raise TypeError(
-                    "@relation_prover, %s, expected to prove a "
-                    "Relation expression, not %s of type %s."
-                    %(func, proven_expr, proven_expr.__class__))
-        if not alter_lhs:
-            expected_lhs = expr
-            if isinstance(expr, ExprRange):
-                expected_lhs = ExprTuple(expr)
-            if proven_expr.lhs != expected_lhs:
+        if is_relation_prover:
+            # Check that the result is of the expected form.
+            proven_expr = proven_truth.expr
+            if not isinstance(proven_expr, _Relation):
                 raise TypeError(
                         "@relation_prover, %s, expected to prove a "
-                        "relation with %s on its left side "
-                        "('lhs').  %s does not satisfy this "
-                        "requirement."%(func, expected_lhs, proven_expr))
-            # Make the style consistent with the original expression.
-            if not proven_expr.lhs.has_same_style(expected_lhs):
-                # Make the left side of the proven truth have a style
-                # that matches the original expression.
-                inner_lhs = proven_truth.inner_expr().lhs
-                proven_truth = inner_lhs.with_matching_style(expected_lhs)
+                        "Relation expression, not %s of type %s."
+                        %(func, proven_expr, proven_expr.__class__))
+            if not alter_lhs:
+                expected_lhs = relation_expr
+                if isinstance(relation_expr, _ExprRange):
+                    expected_lhs = _ExprTuple(relation_expr)
+                if proven_expr.lhs != expected_lhs:
+                    raise TypeError(
+                            "@relation_prover, %s, expected to prove a "
+                            "relation with %s on its left side "
+                            "('lhs').  %s does not satisfy this "
+                            "requirement."%(func, expected_lhs, proven_expr))
+                # Make the style consistent with the original expression.
+                if not proven_expr.lhs.has_same_style(expected_lhs):
+                    # Make the left side of the proven truth have a style
+                    # that matches the original expression.
+                    inner_lhs = proven_truth.inner_expr().lhs
+                    proven_truth = inner_lhs.with_matching_style(expected_lhs)
         return proven_truth
-    return decorated_relation_prover
+    return decorated_prover    
+
 
+# The message appended to the doc string of every decorated prover.
+_DEFAULTS_DOC_SUFFIX = sys.intern("""
+        Keyword arguments are accepted for temporarily changing any
+        of the attributes of proveit.defaults.
+    """)
 
 def _wraps(func, wrapper, extra_doc=None):
     '''
@@ -314,11 +393,10 @@ def _wraps(func, wrapper, extra_doc=None):
     '''
     wrapped = functools.wraps(func)(wrapper)
     if wrapped.__doc__ is None:
-        wrapped.__doc__ = ""
-    wrapped.__doc__ += """
-        Keyword arguments are accepted for temporarily changing any
-        of the attributes of proveit.defaults.
-    """
+        # Share the suffix string itself when there is no doc string.
+        wrapped.__doc__ = _DEFAULTS_DOC_SUFFIX
+    else:
+        wrapped.__doc__ += _DEFAULTS_DOC_SUFFIX
     if extra_doc is not None:
         wrapped.__doc__ += extra_doc
     return wrapped
@@ -351,20 +429,25 @@ def relation_prover(func):
     The style of the original expression will be used on the left side.  
     As with @prover methods, defaults may be temporarily set.
     '''
-    return _wraps(func, _make_decorated_relation_prover(func))
+    return _wraps(func, _make_decorated_prover(func, is_relation_prover=True))
 
 def auto_relation_prover(func):
     '''
 
     '''
-    return _wraps(func, _make_decorated_relation_prover(func, 
-                                                        automatic=True))
+    return _wraps(func, _make_decorated_prover(func, automatic=True,
+                                               is_relation_prover=True))
 
 # Keep track of equivalence provers so we may register them during
 # Expression class construction (see ExprType.__init__ in expr.py).
 _equality_prover_fn_to_tenses = dict()
 _equality_prover_name_to_tenses = dict()
 
+# Reflexive equalities, x = x, of irreducible values x that were
+# returned by 'simplification' or 'evaluation' methods, remembered
+# by the style id of x.
+_irreducible_reflexivity = WeakValueDictionary()
+
 def equality_prover(past_tense, present_tense, automatic=False):
     '''
     @equality_prover works the same way as the @relation_prover decorator
@@ -398,8 +481,8 @@ def equality_prover(past_tense, present_tense, automatic=False):
         is_evaluation_method = (name == 'evaluation')
         is_shallow_simplification_method = (name == 'shallow_simplification')
         is_simplification_method = (name == 'simplification')
-        decorated_relation_prover = _make_decorated_relation_prover(
-            func, automatic=automatic)
+        decorated_relation_prover = _make_decorated_prover(
+            func, automatic=automatic, is_relation_prover=True)
 
         def wrapper(*args, **kwargs):   
             '''
@@ -425,15 +508,21 @@ def equality_prover(past_tense, present_tense, automatic=False):
                 from proveit.logic import is_irreducible_value
                 if is_irreducible_value(expr):
                     # Already irreducible.  Done.
-                    proven_truth = (
+                    proven_truth = _irreducible_reflexivity.get(
+                        expr._style_id)
+                    if proven_truth is None or not proven_truth.is_usable():
+                        proven_truth = (
                             Equals(expr, expr).conclude_via_reflexivity())
+                        _irreducible_reflexivity[expr._style_id] = (
+                            proven_truth)
 
             # If _no_eval_check is set to True, don't bother
             # checking for an existing evaluation.  Used internally
             # in Operation.simplification, Operation.evaluation,
             # Conditional.simplification, and Judgment.simplify.
+            # Skip this if the result is already known (irreducible).
             _no_eval_check = kwargs.pop('_no_eval_check', False)
-            if (not _no_eval_check and (
+            if (proven_truth is None and not _no_eval_check and (
                     is_evaluation_method or
                     (defaults.simplify_with_known_evaluations 
                      and is_simplification_method))):
@@ -154,15 +154,9 @@ class SetOfAll(OperationOverInstances):
             self.instance_element == self.instance_var):
             # simple case of {x | Q(x)}_{x in S};
             # derive x in S side-effect
-            print("(1) SetOfAll.unfold_membership(): inside first if.")
-            print("_Q_op = ")
-            display(_Q_op)
-            print("_Q_op_sub = ")
-            display(_Q_op_sub)
             in_superset_if_in_comprehension.instantiate(
                     {S: self.domain, _Q_op: _Q_op_sub,
                      x: element, y: self.instance_var})
-            print("SetOfAll.unfold_membership(): end")
             if len(self.explicit_conditions())==1:
                 _Q_op, _Q_op_sub = (
                     Function(Q, self.all_instance_vars()), explicit_conditions)
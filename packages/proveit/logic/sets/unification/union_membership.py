@@ -1,9 +1,22 @@
 from proveit import USE_DEFAULTS, equality_prover, prover
 from proveit.logic import SetMembership, SetNonmembership
-from proveit.numbers import num
 from proveit import m, A, x
 
 
+def _union_membership_repl_map(element, union):
+    '''
+    Return the replacement map, {m: _m, x: element, A: _A}, for
+    instantiating the union (non)membership theorems where _A are the
+    operands of the union and _m is their proven number of elements.
+    The number of elements is computed once here; Len remembers its
+    computation under the current assumptions, replacements, and
+    simplification/preservation settings, so repeated membership
+    queries on the same union under the same defaults reuse that proof.
+    '''
+    _A = union.operands
+    return {m: _A.num_elements(), x: element, A: _A}
+
+
 class UnionMembership(SetMembership):
     '''
     Defines methods that apply to membership in a union of sets.
@@ -27,12 +40,9 @@ class UnionMembership(SetMembership):
         where self = (A union B ...).
         '''
         from . import union_def
-        element = self.element
-        operands = self.domain.operands
-        _A = operands
-        _m = _A.num_elements()
         return union_def.instantiate(
-                {m: _m, x: element, A: _A}, auto_simplify=False)
+            _union_membership_repl_map(self.element, self.domain),
+            auto_simplify=False)
 
     def as_defined(self):
         '''
@@ -52,12 +62,9 @@ class UnionMembership(SetMembership):
         where self represents [element in (A union B ...)].
         '''
         from . import membership_unfolding
-        element = self.element
-        operands = self.domain.operands
-        _A = operands
-        _m = _A.num_elements()
         return membership_unfolding.instantiate(
-            {m: _m, x: element, A: _A}, auto_simplify=False)
+            _union_membership_repl_map(self.element, self.domain),
+            auto_simplify=False)
 
     @prover
     def conclude(self, **defaults_config):
@@ -67,11 +74,8 @@ class UnionMembership(SetMembership):
         return self.
         '''
         from . import membership_folding
-        element = self.element
-        operands = self.domain.operands
-        _A = operands
-        _m = _A.num_elements()
-        return membership_folding.instantiate({m: _m, x: element, A: _A})
+        return membership_folding.instantiate(
+            _union_membership_repl_map(self.element, self.domain))
 
 
 class UnionNonmembership(SetNonmembership):
@@ -97,12 +101,9 @@ class UnionNonmembership(SetNonmembership):
             [(element not in A) and (element not in B) and ...].
         '''
         from . import nonmembership_equiv
-        element = self.element
-        operands = self.domain.operands
-        _A = operands
-        _m = _A.num_elements()
         return nonmembership_equiv.instantiate(
-            {m: _m, x: element, A: _A}, auto_simplify=False)
+            _union_membership_repl_map(self.element, self.domain),
+            auto_simplify=False)
 
     def as_defined(self):
         '''
@@ -122,9 +123,5 @@ class UnionNonmembership(SetNonmembership):
         derive and return self.
         '''
         from . import nonmembership_folding
-        element = self.element
-        operands = self.domain.operands
-        _A = operands
-        _m = _A.num_elements()
         return nonmembership_folding.instantiate(
-            {m: _m, x: element, A: _A})
+            _union_membership_repl_map(self.element, self.domain))
@@ -630,7 +630,7 @@ class ProveItMagicCommands:
         elif kind == 'theorems':
             self.theory._clear_theorems()
         elif kind == 'common':
-            self.theory._clear_common_exressions()
+            self.theory._clear_common_expressions()
         elif Judgment.theorem_being_proven is not None:
             kind = '_proof_' + Judgment.theorem_being_proven.name
         # clean unreferenced expressions:
@@ -16,10 +16,10 @@ class Abs(NumberOperation):
                                  styles=styles)
 
     def string(self, **kwargs):
-        return '|' + self.operand.string() + '|'
+        return ''.join(('|', self.operand.string(), '|'))
 
     def latex(self, **kwargs):
-        return r'\left|' + self.operand.latex() + r'\right|'
+        return ''.join((r'\left|', self.operand.latex(), r'\right|'))
     
     def _build_canonical_form(self):
         '''
@@ -58,11 +58,8 @@ class Div(NumberOperation):
             # exponentiation is an example of when fencing should be forced)
             kwargs['fence'] = kwargs['force_fence'] if 'force_fence' in kwargs else False
             return maybe_fenced_latex(
-                r'\frac{' +
-                self.numerator.latex() +
-                '}{' +
-                self.denominator.latex() +
-                '}',
+                ''.join((r'\frac{', self.numerator.latex(), '}{',
+                         self.denominator.latex(), '}')),
                 **kwargs)
         else:
             # normal division
@@ -80,45 +80,42 @@ class Exp(NumberOperation):
         return self.formatted('latex', **kwargs)
 
     def formatted(self, format_type, **kwargs):
+        # Remember the formatting (see Expression._remembered_formatted).
+        key = ('exp', format_type, tuple(sorted(kwargs.items())))
+        return self._remembered_formatted(
+            key, lambda: self._generate_formatted(format_type, **kwargs))
+
+    def _generate_formatted(self, format_type, **kwargs):
+        '''
+        Helper for 'formatted' that generates the formatted string
+        without consulting the cache.
+        '''
         # begin building the inner_str
-        inner_str = self.base.formatted(
+        formatted_base = self.base.formatted(
             format_type, fence=True, force_fence=True)
+        inner_str = formatted_base
         # if self.get_style('exponent', 'TEST') == 'TEST' and self.exponent == frac(one, two):
         #     self.with_radical()
         if self.get_style('exponent', 'raised') == 'raised':
-            inner_str = (
-                inner_str
-                + r'^{' + self.exponent.formatted(format_type, fence=False)
-                + '}')
+            inner_str = ''.join((
+                formatted_base, r'^{',
+                self.exponent.formatted(format_type, fence=False), '}'))
         elif self.get_style('exponent') == 'radical':
             if self.exponent == frac(one, two):
                 if format_type == 'string':
-                    inner_str = (
-                        r'sqrt('
-                        + self.base.formatted(format_type, fence=True,
-                                              force_fence=True)
-                        + ')')
+                    inner_str = ''.join((r'sqrt(', formatted_base, ')'))
                 elif format_type == 'latex':
-                    inner_str = (
-                        r'\sqrt{'
-                        + self.base.formatted(format_type, fence=True,
-                                              force_fence=True)
-                        + '}')
+                    inner_str = ''.join((r'\sqrt{', formatted_base, '}'))
             elif isinstance(self.exponent, Div):
+                formatted_root = self.exponent.denominator.formatted(
+                    format_type, fence=False)
                 if format_type == 'string':
-                    inner_str = (
-                            self.exponent.denominator.formatted(format_type, fence=False)
-                            + r' radical('
-                            + self.base.formatted(format_type, fence=True,
-                                                  force_fence=True)
-                            + ')')
+                    inner_str = ''.join((
+                        formatted_root, r' radical(', formatted_base, ')'))
                 elif format_type == 'latex':
-                    inner_str = (
-                            r'\sqrt[\leftroot{-3}\uproot{3}'
-                            + self.exponent.denominator.formatted(format_type, fence=False) + ']{'
-                            + self.base.formatted(format_type, fence=True,
-                                                  force_fence=True)
-                            + '}')
+                    inner_str = ''.join((
+                        r'\sqrt[\leftroot{-3}\uproot{3}', formatted_root,
+                        ']{', formatted_base, '}'))
             else:
                 raise ValueError(
                     "Unknown radical type, exponentiating to the power "
@@ -3,9 +3,8 @@ from proveit import ( defaults,
         relation_prover)
 from proveit import a, b
 from proveit.numbers import (
-        zero, one, infinity, Interval, IntervalCC, IntervalCO, IntervalOC,
-        IntervalOO, Neg, NumberOperation, Real, RealNeg, RealNonNeg,
-        RealNonPos, RealPos)
+        zero, one, infinity, Interval, RealInterval, IntervalCC, Neg,
+        NumberOperation, Real, RealNeg, RealNonNeg, RealNonPos, RealPos)
 
 
 class Integrate(OperationOverInstances):
@@ -98,6 +97,12 @@ class Integrate(OperationOverInstances):
 
 
     def _formatted(self, format_type, **kwargs):
+        # Remember the formatting (see Expression._remembered_formatted).
+        key = ('integrate', format_type, tuple(sorted(kwargs.items())))
+        return self._remembered_formatted(
+            key, lambda: self._generate_formatted(format_type, **kwargs))
+
+    def _generate_formatted(self, format_type, **kwargs):
         # ACTUALLY, notice that the open-interval versions
         # probably lead to incorrect upper/lower bounds on the
         # formatted integrals. For example, an integral over the
@@ -105,28 +110,23 @@ class Integrate(OperationOverInstances):
         # or expressed as a limit as 'a' approaches 0 from the right
         # of the integral from 0 to 1.
         fence = kwargs['fence'] if 'fence' in kwargs else False
-        if (isinstance(self.domain,IntervalCC) or
-            isinstance(self.domain,IntervalCO) or
-            isinstance(self.domain,IntervalOC) or
-            isinstance(self.domain,IntervalOO)):
-
+        if isinstance(self.domain, RealInterval):
             lower = self.domain.lower_bound.formatted(format_type)
             upper = self.domain.upper_bound.formatted(format_type)
-            formatted_inner = (
-                    self.operator.formatted(format_type) +
-                    r'_{' + lower + r'}' + r'^{' + upper + r'} ')
+            pieces = [self.operator.formatted(format_type),
+                      r'_{', lower, r'}', r'^{', upper, r'} ']
             explicit_ivars = list(self.explicit_instance_vars())
             has_explicit_ivars = (len(explicit_ivars) > 0)
             explicit_conds = list(self.explicit_conditions())
             has_explicit_conds = (len(explicit_conds) > 0)
             if has_explicit_conds:
                 if has_explicit_ivars:
-                    formatted_inner += " | "
-                formatted_inner += ', '.join(condition.formatted(format_type)
-                                             for condition in explicit_conds)
-            formatted_inner += (
-                    self.integrand.formatted(format_type, fence=fence) +
-                    r'\,d' + self.index.formatted(format_type))
+                    pieces.append(" | ")
+                pieces.append(', '.join(condition.formatted(format_type)
+                                        for condition in explicit_conds))
+            pieces.extend((self.integrand.formatted(format_type, fence=fence),
+                           r'\,d', self.index.formatted(format_type)))
+            formatted_inner = ''.join(pieces)
 
             # old/previous
             # return (self.operator.formatted(format_type) +
@@ -369,6 +369,13 @@ nonzero_number_set = {
     Complex: ComplexNonZero,
     ComplexNonZero: ComplexNonZero}
 
+# Results of top-level readily_provable_number_set calls, remembered
+# until the record of proofs changes (see Judgment.proof_record_count).
+_readily_provable_number_sets = dict()
+_readily_provable_number_sets_record_count = None
+# Stands in for "no readily provable number set" in the above.
+_no_number_set = object()
+
 def readily_provable_number_set(
         expr, *, automation=True, must_be_direct=False, default=None, 
         _check_order_against_zero=True):
@@ -389,6 +396,43 @@ def readily_provable_number_set(
     _check_order_against_zero is set to False internally to avoid infinite
     recursion.
     '''
+    global _readily_provable_number_sets_record_count
+    if len(Expression.in_progress_to_check_provability) > 0:
+        # Nested within a provability check, the result may be
+        # limited by the recursion guard; don't remember it.
+        return _readily_provable_number_set(
+            expr, automation=automation, must_be_direct=must_be_direct,
+            default=default,
+            _check_order_against_zero=_check_order_against_zero)
+    record_count = Judgment.proof_record_count
+    if _readily_provable_number_sets_record_count != record_count:
+        # Something has been proven (or disabled) since; start over.
+        _readily_provable_number_sets.clear()
+        _readily_provable_number_sets_record_count = record_count
+    key = (expr, automation, must_be_direct, _check_order_against_zero,
+           defaults.sorted_assumptions)
+    number_set = _readily_provable_number_sets.get(key, None)
+    if number_set is None:
+        number_set = _readily_provable_number_set(
+            expr, automation=automation, must_be_direct=must_be_direct,
+            default=_no_number_set,
+            _check_order_against_zero=_check_order_against_zero)
+        if Judgment.proof_record_count == record_count:
+            _readily_provable_number_sets[key] = number_set
+    if number_set is _no_number_set:
+        if default is None:
+            raise UnsatisfiedPrerequisites(
+                "No readily provable number set for %s"%expr)
+        return default
+    return number_set
+
+def _readily_provable_number_set(
+        expr, *, automation, must_be_direct, default, 
+        _check_order_against_zero):
+    '''
+    Helper for 'readily_provable_number_set' that determines the
+    number set without consulting what has been remembered.
+    '''
     from proveit.logic import (InClass, Equals, NotEquals, 
                                is_irreducible_value)
     from proveit.numbers import Less, LessEq, zero
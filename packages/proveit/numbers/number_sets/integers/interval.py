@@ -22,12 +22,12 @@ class Interval(Operation):
         self.upper_bound = upper_bound
 
     def string(self, **kwargs):
-        return '{' + self.lower_bound.string() + ' .. ' + \
-            self.upper_bound.string() + '}'
+        return ''.join(('{', self.lower_bound.string(), ' .. ',
+                        self.upper_bound.string(), '}'))
 
     def latex(self, **kwargs):
-        return r'\{' + self.lower_bound.latex() + r'~\ldotp \ldotp~' + \
-            self.upper_bound.latex() + r'\}'
+        return ''.join((r'\{', self.lower_bound.latex(), r'~\ldotp \ldotp~',
+                        self.upper_bound.latex(), r'\}'))
 
     def membership_object(self, element):
         from .interval_membership import IntervalMembership
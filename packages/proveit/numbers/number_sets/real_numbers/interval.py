@@ -48,12 +48,12 @@ class IntervalOO(RealInterval):
             styles=styles)
 
     def string(self, **kwargs):
-        return '(' + self.lower_bound.string() + \
-            ',' + self.upper_bound.string() + ')'
+        return ''.join(('(', self.lower_bound.string(), ',',
+                        self.upper_bound.string(), ')'))
 
     def latex(self, **kwargs):
-        return (r'\left(' + self.lower_bound.latex() + ','
-                + self.upper_bound.latex() + r'\right)')
+        return ''.join((r'\left(', self.lower_bound.latex(), ',',
+                        self.upper_bound.latex(), r'\right)'))
 
     def membership_object(self, element):
         from .real_interval_membership import IntervalOOMembership
@@ -133,12 +133,12 @@ class IntervalOC(RealInterval):
             styles=styles)
 
     def string(self, **kwargs):
-        return '(' + self.lower_bound.string() + \
-            ',' + self.upper_bound.string() + ']'
+        return ''.join(('(', self.lower_bound.string(), ',',
+                        self.upper_bound.string(), ']'))
 
     def latex(self, **kwargs):
-        return (r'\left(' + self.lower_bound.latex() + ','
-                + self.upper_bound.latex() + r'\right]')
+        return ''.join((r'\left(', self.lower_bound.latex(), ',',
+                        self.upper_bound.latex(), r'\right]'))
 
     def membership_object(self, element):
         from .real_interval_membership import IntervalOCMembership
@@ -206,12 +206,12 @@ class IntervalCO(RealInterval):
             styles=styles)
 
     def string(self, **kwargs):
-        return '[' + self.lower_bound.string() + ',' + \
-            self.upper_bound.string() + ')'
+        return ''.join(('[', self.lower_bound.string(), ',',
+                        self.upper_bound.string(), ')'))
 
     def latex(self, **kwargs):
-        return (r'\left[' + self.lower_bound.latex() + ','
-                + self.upper_bound.latex() + r'\right)')
+        return ''.join((r'\left[', self.lower_bound.latex(), ',',
+                        self.upper_bound.latex(), r'\right)'))
 
     def membership_object(self, element):
         from .real_interval_membership import IntervalCOMembership
@@ -279,12 +279,12 @@ class IntervalCC(RealInterval):
             styles=styles)
 
     def string(self, **kwargs):
-        return '[' + self.lower_bound.string() + ',' + \
-            self.upper_bound.string() + ']'
+        return ''.join(('[', self.lower_bound.string(), ',',
+                        self.upper_bound.string(), ']'))
 
     def latex(self, **kwargs):
-        return (r'\left[' + self.lower_bound.latex() + ','
-                + self.upper_bound.latex() + r'\right]')
+        return ''.join((r'\left[', self.lower_bound.latex(), ',',
+                        self.upper_bound.latex(), r'\right]'))
 
     def membership_object(self, element):
         from .real_interval_membership import IntervalCCMembership
@@ -241,23 +241,25 @@ class Less(NumberOrderingRelation):
         if isinstance(other, Equals):
             return NumberOrderingRelation.apply_transitivity(
                 self, other)  # handles this special case
-        elif other.lower == self.upper:
+        lower, upper = self.lower, self.upper
+        other_lower, other_upper = other.lower, other.upper
+        if other_lower == upper:
             if isinstance(other, Less):
                 new_rel = transitivity_less_less.instantiate(
-                    {x: self.lower, y: self.upper, z: other.upper},
+                    {x: lower, y: upper, z: other_upper},
                     preserve_all=True)
             elif isinstance(other, LessEq):
                 new_rel = transitivity_less_less_eq.instantiate(
-                    {x: self.lower, y: self.upper, z: other.upper},
+                    {x: lower, y: upper, z: other_upper},
                     preserve_all=True)
-        elif other.upper == self.lower:
+        elif other_upper == lower:
             if isinstance(other, Less):
                 new_rel = transitivity_less_less.instantiate(
-                    {x: other.lower, y: self.lower, z: self.upper},
+                    {x: other_lower, y: lower, z: upper},
                     preserve_all=True)
             elif isinstance(other, LessEq):
                 new_rel = transitivity_less_eq_less.instantiate(
-                    {x: other.lower, y: self.lower, z: self.upper},
+                    {x: other_lower, y: lower, z: upper},
                     preserve_all=True)
         else:
             raise ValueError(
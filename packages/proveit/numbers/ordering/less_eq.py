@@ -186,27 +186,29 @@ class LessEq(NumberOrderingRelation):
         if isinstance(other, Equals):
             return NumberOrderingRelation.apply_transitivity(
                 self, other)  # handles this special case
-        if other.lower == self.upper and other.upper == self.lower:
+        lower, upper = self.lower, self.upper
+        other_lower, other_upper = other.lower, other.upper
+        if other_lower == upper and other_upper == lower:
             # x <= y and y <= x implies that x=y
             return symmetric_less_eq.instantiate(
-                {x: self.lower, y: self.upper})
-        elif other.lower == self.upper:
+                {x: lower, y: upper})
+        elif other_lower == upper:
             if isinstance(other, Less):
                 new_rel = transitivity_less_eq_less.instantiate(
-                    {x: self.lower, y: self.upper, z: other.upper},
+                    {x: lower, y: upper, z: other_upper},
                     preserve_all=True)
             elif isinstance(other, LessEq):
                 new_rel = transitivity_less_eq_less_eq.instantiate(
-                    {x: self.lower, y: self.upper, z: other.upper},
+                    {x: lower, y: upper, z: other_upper},
                     preserve_all=True)
-        elif other.upper == self.lower:
+        elif other_upper == lower:
             if isinstance(other, Less):
                 new_rel = transitivity_less_less_eq.instantiate(
-                    {x: other.lower, y: other.upper, z: self.upper},
+                    {x: other_lower, y: other_upper, z: upper},
                     preserve_all=True)
             elif isinstance(other, LessEq):
                 new_rel = transitivity_less_eq_less_eq.instantiate(
-                    {x: other.lower, y: other.upper, z: self.upper},
+                    {x: other_lower, y: other_upper, z: upper},
                     preserve_all=True)
         else:
             raise ValueError(
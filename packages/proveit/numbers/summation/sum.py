@@ -152,7 +152,25 @@ class Sum(OperationOverInstances):
         if Real.readily_includes(summand_ns): return Real
         return Complex
 
+    def _f_of_index(self):
+        '''
+        Return f(index), paired with the summand when instantiating
+        the summation theorems.  It is made once per Sum and then
+        remembered.
+        '''
+        try:
+            return self._f_of_index_operation
+        except AttributeError:
+            self._f_of_index_operation = Function(f, self.index)
+            return self._f_of_index_operation
+
     def _formatted(self, format_type, **kwargs):
+        # Remember the formatting (see Expression._remembered_formatted).
+        key = ('sum', format_type, tuple(sorted(kwargs.items())))
+        return self._remembered_formatted(
+            key, lambda: self._generate_formatted(format_type, **kwargs))
+
+    def _generate_formatted(self, format_type, **kwargs):
         # MUST BE UPDATED TO DEAL WITH 'joining' NESTED LEVELS
         fence = kwargs['fence'] if 'fence' in kwargs else False
         explicit_conds = self.explicit_conditions()          
@@ -193,7 +211,7 @@ class Sum(OperationOverInstances):
             self.domain.lower_bound == self.domain.upper_bound):
             if hasattr(self, 'index'):
                 return sum_single.instantiate(
-                    {Function(f, self.index): summand,
+                    {self._f_of_index(): summand,
                      a: self.domain.lower_bound})
         if (isinstance(self.domain,Interval) and
                 self.instance_param not in free_vars(summand)
@@ -231,13 +249,20 @@ class Sum(OperationOverInstances):
         ∑_{n=j}^{k} x^n = (x^{k + 1} - x^j) / (x - 1)
         '''
         from . import inf_geom_sum, gen_finite_geom_sum
-        from proveit.numbers import zero, infinity
+        from proveit.numbers import zero, infinity, Exp
 
-        try:
-            #            self.r = extract_exp_base(self.summand)
-            _x_sub = self.summand.base
-        except BaseException:
+        # Rule out non-geometric forms up front rather than failing
+        # within a theorem instantiation.
+        if not isinstance(self.summand, Exp):
             raise ValueError("Summand not an exponential!")
+        if (not hasattr(self, 'index') or
+                self.summand.exponent != self.index):
+            raise ValueError("Not a geometric sum: the exponent of the "
+                             "summand must be the summation index!")
+        _x_sub = self.summand.base
+        if self.index in free_vars(_x_sub):
+            raise ValueError("Not a geometric sum: the base of the "
+                             "summand depends upon the summation index!")
         if not isinstance(self.domain, Interval):
             raise ValueError("Not explicitly summing over Interval!")
         else:
@@ -295,7 +320,7 @@ class Sum(OperationOverInstances):
         _b = self.domain.upper_bound
         _c = shift_amount
 
-        f_op, f_op_sub = Function(f, self.index), self.summand
+        f_op, f_op_sub = self._f_of_index(), self.summand
 
         """
         # SHOULD BE HANDLED VIA AUTO-SIMPLIFICATION NOW.
@@ -350,7 +375,7 @@ class Sum(OperationOverInstances):
                 "index over an Interval. The sum {} has domain {}."
                 .format(self, self.domain))
          
-        f_op, f_op_sub = Function(f, self.index), self.summand
+        f_op, f_op_sub = self._f_of_index(), self.summand
         return index_negate.instantiate(
             {f_op: f_op_sub, x: _x, a: _a, b: _b})
     
@@ -399,7 +424,7 @@ class Sum(OperationOverInstances):
         _b1 = self.domain.upper_bound
         _a2 = second_summation.domain.lower_bound
         _b2 = second_summation.domain.upper_bound
-        f_op, f_op_sub = Function(f, self.index), self.summand
+        f_op, f_op_sub = self._f_of_index(), self.summand
 
         # Create low-effort, simplified versions of transition index
         # values, if possible
@@ -495,7 +520,7 @@ class Sum(OperationOverInstances):
         _a = self.domain.lower_bound
         _b = split_index
         _c = self.domain.upper_bound
-        f_op, f_op_sub = Function(f, self.index), self.summand
+        f_op, f_op_sub = self._f_of_index(), self.summand
 
         """
         # SHOULD BE HANDLED VIA AUTO-SIMPLIFICATION NOW.
@@ -554,7 +579,7 @@ class Sum(OperationOverInstances):
             _i = self.index
             _a = self.domain.lower_bound
             _b = self.domain.upper_bound
-            f_op, f_op_sub = Function(f, self.index), self.summand
+            f_op, f_op_sub = self._f_of_index(), self.summand
 
             """
             # SHOULD BE HANDLED VIA AUTO-SIMPLIFICATION NOW.
@@ -620,7 +645,7 @@ class Sum(OperationOverInstances):
             _i = self.index
             _a = self.domain.lower_bound
             _b = self.domain.upper_bound
-            f_op, f_op_sub = Function(f, self.index), self.summand
+            f_op, f_op_sub = self._f_of_index(), self.summand
 
             """
             # SHOULD BE HANDLED VIA AUTO-SIMPLIFICATION NOW.
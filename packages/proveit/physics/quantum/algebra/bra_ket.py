@@ -5,6 +5,7 @@ from proveit.logic import Equals, NotEquals, deduce_equal_or_not
 from proveit.numbers import one, Complex
 from proveit.relation import TransRelUpdater
 
+
 class Bra(Function):
     '''
     Class to represent a Dirac bra vector of the form ⟨0| or ⟨1|.
@@ -23,14 +24,16 @@ class Bra(Function):
         return self.formatted('latex', **kwargs)
     
     def formatted(self, format_type, **kwargs):
+        return self._remembered_formatted(
+            ('dirac', format_type),
+            lambda: self._generate_formatted(format_type))
+
+    def _generate_formatted(self, format_type):
+        formatted_label = self.label.formatted(format_type, fence=False)
         if format_type == 'latex':
-            return (r'\langle '
-                    + self.label.formatted(format_type, fence=False)
-                    + r' \rvert')
+            return ''.join((r'\langle ', formatted_label, r' \rvert'))
         else:  # using the unicode \u2329 for the left angle bracket
-            return (u'\u2329'
-                    + self.label.formatted(format_type, fence=False)
-                    + '|')
+            return ''.join((u'\u2329', formatted_label, '|'))
 
     # could instead use string() or latex() method instead
 
@@ -52,17 +55,19 @@ class Ket(Function):
         return self.formatted('latex', **kwargs)
     
     def formatted(self, format_type, no_lvert=False, **kwargs):
+        return self._remembered_formatted(
+            ('dirac', format_type, no_lvert),
+            lambda: self._generate_formatted(format_type, no_lvert))
+
+    def _generate_formatted(self, format_type, no_lvert):
         left_str = r'\lvert ' if format_type == 'latex' else '|'
         if no_lvert:
             left_str = ''
+        formatted_label = self.label.formatted(format_type, fence=False)
         if format_type == 'latex':
-            return (left_str +
-                    self.label.formatted(format_type, fence=False) +
-                    r' \rangle')
+            return ''.join((left_str, formatted_label, r' \rangle'))
         else:  # using the unicode \u232A for the right angle bracket
-            return (left_str
-                    + self.label.formatted(format_type, fence=False)
-                    + u'\u232A')
+            return ''.join((left_str, formatted_label, u'\u232A'))
     
 class NumBra(Function):
     '''
@@ -93,6 +98,11 @@ class NumBra(Function):
         return self.formatted('latex', **kwargs)
     
     def formatted(self, format_type, fence=False):
+        return self._remembered_formatted(
+            ('dirac', format_type),
+            lambda: self._generate_formatted(format_type))
+
+    def _generate_formatted(self, format_type):
         formatted_label = self.num.formatted(format_type, fence=False)
         formatted_size = self.size.formatted(format_type, fence=False)
         if format_type == 'latex':
@@ -102,11 +112,11 @@ class NumBra(Function):
             # isn't working in the ipynbs
             # return (r'\prescript{}{' + formatted_size + r'}\langle '
             #         + formatted_label + r' \rvert')
-            return (r'{_{' + formatted_size + r'}}\langle '
-                    + formatted_label + r' \rvert')
+            return ''.join((r'{_{', formatted_size, r'}}\langle ',
+                            formatted_label, r' \rvert'))
         else:
-            return '{' + formatted_size + '}_' + \
-                u'\u2329' + formatted_label + '|'
+            return ''.join(('{', formatted_size, u'}_\u2329',
+                            formatted_label, '|'))
 
     def deduce_in_vec_space(self, vec_space=None, *, field,
                             **defaults_config):
@@ -152,17 +162,22 @@ class NumKet(Function):
         return self.formatted('latex', **kwargs)
     
     def formatted(self, format_type, fence=False, no_lvert=False):
+        return self._remembered_formatted(
+            ('dirac', format_type, no_lvert),
+            lambda: self._generate_formatted(format_type, no_lvert))
+
+    def _generate_formatted(self, format_type, no_lvert):
         formatted_label = self.num.formatted(format_type, fence=False)
         formatted_size = self.size.formatted(format_type, fence=False)
         left_str = r'\lvert ' if format_type == 'latex' else '|'
         if no_lvert:
             left_str = ''
         if format_type == 'latex':
-            return (left_str + formatted_label + r' \rangle_{'
-                    + formatted_size + '}')
+            return ''.join((left_str, formatted_label, r' \rangle_{',
+                            formatted_size, '}'))
         else:
-            return (left_str + formatted_label + u'\u232A' + '_{'
-                    + formatted_size + '}')
+            return ''.join((left_str, formatted_label, u'\u232A_{',
+                            formatted_size, '}'))
 
     @equality_prover('shallow_simplified', 'shallow_simplify')
     def shallow_simplification(self, *, must_evaluate=False,
@@ -34,6 +34,13 @@ class TransitiveRelation(Relation):
     TransitiveRelation which is also symmetric (x=y means that y=x).
     '''
 
+    # Transitivity searches that failed without automation, as
+    # (relation class, left item, right item, assumptions) keys.  These
+    # are remembered until another proof is recorded (as indicated by
+    # Judgment.proof_record_count).
+    _failed_search_keys = set()
+    _failed_searches_record_count = None
+
     def __init__(self, operator, normal_lhs, normal_rhs, *, styles):
         Relation.__init__(self,operator, normal_lhs, normal_rhs, styles=styles)
     
@@ -693,6 +700,19 @@ class TransitiveRelation(Relation):
             return (first, last)
         return point
 
+    @staticmethod
+    def _failed_searches():
+        '''
+        Return the set of remembered failed (non-automated)
+        transitivity search keys, forgetting them first if anything
+        has been proven since they failed.
+        '''
+        record_count = Judgment.proof_record_count
+        if TransitiveRelation._failed_searches_record_count != record_count:
+            TransitiveRelation._failed_search_keys.clear()
+            TransitiveRelation._failed_searches_record_count = record_count
+        return TransitiveRelation._failed_search_keys
+
     @classmethod
     @prover
     def _transitivity_search(cls, left_item, right_item,
@@ -710,6 +730,17 @@ class TransitiveRelation(Relation):
         if left_item == right_item:
             # Items are the exact same, so they are equal.
             return equiv_class(left_item, right_item).prove()
+        if not defaults.conclude_automation:
+            # Without automation, a search that failed before will fail
+            # again unless something new has been proven.
+            failure_key = (cls, left_item, right_item,
+                           defaults.sorted_assumptions)
+            if failure_key in TransitiveRelation._failed_searches():
+                relation = cls(left_item, right_item)
+                msg = ('No proof found via applying transitivity amongst'
+                       ' known proven relations.')
+                raise TransitivityException(relation, defaults.assumptions,
+                                            msg)
         try:
             # Try the strong relation first.
             StrongClass = cls._checkedStrongRelationClass()
@@ -734,6 +765,7 @@ class TransitiveRelation(Relation):
                     pass
 
         if not defaults.conclude_automation:
+            TransitiveRelation._failed_searches().add(failure_key)
             relation = cls(left_item, right_item)
             msg = ('No proof found via applying transitivity amongst'
                    ' known proven relations.')
@@ -80,12 +80,18 @@ class OrderedSet(MutableSet):
         self._lst.remove(elem)
 
     def __le__(self, other):
+        if isinstance(other, OrderedSet):
+            # Compare the underlying sets directly.
+            return self._set <= other._set
         return all(e in other for e in self)
 
     def __lt__(self, other):
         return self <= other and self != other
 
     def __ge__(self, other):
+        if isinstance(other, OrderedSet):
+            # Compare the underlying sets directly.
+            return self._set >= other._set
         return all(e in self for e in other)
 
     def __gt__(self, other):
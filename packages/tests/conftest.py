@@ -0,0 +1,24 @@
+import itertools
+import pytest
+from proveit import Variable, Judgment, defaults
+from proveit._core_.proof import Assumption
+
+_new_proof_indices = itertools.count()
+
+
+@pytest.fixture
+def record_new_proof():
+    '''
+    Return a function that records a new proof (of a fresh assumption)
+    so remembered results that depend upon what has been proven are
+    forgotten.
+    '''
+    def record():
+        record_count = Judgment.proof_record_count
+        assumption = Variable('_new_proof_%d' % next(_new_proof_indices))
+        with defaults.temporary() as temp_defaults:
+            temp_defaults.assumptions = [assumption]
+            temp_defaults.automation = False
+            Assumption.make_assumption(assumption)
+        assert Judgment.proof_record_count != record_count
+    return record
@@ -0,0 +1,22 @@
+from proveit import Variable, Lambda, Conditional, Function
+
+x, y, z, f, Q = [Variable(_s) for _s in ('x', 'y', 'z', 'f', 'Q')]
+
+
+def test_replacement_of_lambda_key_matching_by_meaning():
+    # Lambda(x, x) and Lambda(y, y) have the same meaning, so the
+    # replacement applies even though the key and the Conditional
+    # use different Variables.
+    conditional = Conditional(Function(f, Lambda(y, y)),
+                              Function(Q, Lambda(y, y)))
+    replaced = conditional.basic_replaced({Lambda(x, x): z})
+    assert replaced.value == Function(f, z)
+    assert replaced.condition == Function(Q, z)
+
+
+def test_replacement_skipped_for_unused_variables():
+    conditional = Conditional(Function(f, y), Function(Q, y))
+    assert conditional.basic_replaced({x: z}) is conditional
+    replaced = conditional.basic_replaced({y: z})
+    assert replaced.value == Function(f, z)
+    assert replaced.condition == Function(Q, z)
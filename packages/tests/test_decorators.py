@@ -0,0 +1,40 @@
+import pytest
+from proveit import Variable, defaults, prover
+from proveit.decorators import _irreducible_reflexivity
+from proveit._core_.proof import Assumption
+
+P = Variable('P')
+
+
+class _Assumer:
+    def __init__(self, expr):
+        self.expr = expr
+
+    @prover
+    def assumed(self, **defaults_config):
+        return Assumption.make_assumption(self.expr).proven_truth
+
+
+def test_prover_with_and_without_keyword_arguments(record_new_proof):
+    assumer = _Assumer(P)
+    with defaults.temporary() as temp_defaults:
+        temp_defaults.assumptions = [P]
+        temp_defaults.automation = False
+        # Without keyword arguments, the fast path is taken.
+        fast_truth = assumer.assumed()
+        record_new_proof()
+        assert assumer.assumed() == fast_truth
+    slow_truth = assumer.assumed(assumptions=[P], automation=False)
+    assert slow_truth == fast_truth
+    assert fast_truth.expr == P
+    assert set(fast_truth.assumptions) == {P}
+
+
+def test_irreducible_reflexivity_remembered(record_new_proof):
+    logic = pytest.importorskip('proveit.logic', exc_type=ImportError)
+    TRUE = logic.TRUE
+    simplification = TRUE.simplification()
+    assert _irreducible_reflexivity[TRUE._style_id] is simplification
+    assert TRUE.simplification() is simplification
+    record_new_proof()
+    assert TRUE.simplification().expr == simplification.expr
@@ -0,0 +1,34 @@
+import copy
+import pickle
+from proveit import Variable, ExprTuple
+
+a, b = Variable('a'), Variable('b')
+
+
+def test_empty_expr_tuple_is_shared():
+    assert ExprTuple() is ExprTuple()
+    assert ExprTuple(a, b) is not ExprTuple(a, b)
+
+
+def test_copies_do_not_alter_shared_empty_expr_tuple():
+    empty = ExprTuple()
+    expr_tuple = ExprTuple(a, b)
+    for expr_copy in (copy.copy(expr_tuple), copy.deepcopy(expr_tuple),
+                      pickle.loads(pickle.dumps(expr_tuple))):
+        assert expr_copy is not empty
+        assert expr_copy == expr_tuple
+        assert expr_copy.string() == '(a, b)'
+    assert ExprTuple() is empty
+    assert ExprTuple().string() == '()'
+    assert len(ExprTuple().entries) == 0
+
+
+def test_empty_expr_tuple_with_styles_is_not_shared(record_new_proof):
+    empty = ExprTuple()
+    styled_empty = ExprTuple(styles=dict())
+    assert styled_empty is not empty
+    assert styled_empty == empty
+    assert styled_empty.latex() == empty.latex()
+    record_new_proof()
+    assert ExprTuple() is empty
+    assert ExprTuple().latex() == styled_empty.latex()
@@ -0,0 +1,26 @@
+from proveit import (Variable, Lambda, Function, ExprTuple, used_vars)
+
+x, y, f = Variable('x'), Variable('y'), Variable('f')
+
+
+def test_used_vars_remembered():
+    expr = Function(f, Lambda(x, ExprTuple(x, y)))
+    assert used_vars(expr) == {f, x, y}
+    assert expr._used_vars() is expr._used_vars()
+    assert used_vars(expr) == {f, x, y}
+
+
+def test_used_vars_returns_a_fresh_set(record_new_proof):
+    expr = Function(f, x)
+    vars_used = used_vars(expr)
+    vars_used.add(y)
+    assert used_vars(expr) == {f, x}
+    record_new_proof()
+    assert used_vars(expr) == {f, x}
+
+
+def test_used_vars_across_styles():
+    expr = ExprTuple(f, x, y)
+    wrapped_expr = expr.with_wrapping_at(2)
+    assert wrapped_expr._style_id != expr._style_id
+    assert used_vars(wrapped_expr) == used_vars(expr) == {f, x, y}
@@ -0,0 +1,49 @@
+from proveit import Variable, ExprTuple, Judgment
+
+a, b, c = Variable('a'), Variable('b'), Variable('c')
+
+
+def test_unhashable_formatting_key_is_not_remembered():
+    expr_tuple = ExprTuple(a, b)
+    generated = []
+
+    def generate():
+        generated.append(None)
+        return 'generated'
+    key = ('unhashable', [1, 2])
+    assert expr_tuple._remembered_formatted(key, generate) == 'generated'
+    assert expr_tuple._remembered_formatted(key, generate) == 'generated'
+    assert len(generated) == 2
+    assert expr_tuple.string() == '(a, b)'
+
+
+def test_formatted_cache_hit():
+    expr_tuple = ExprTuple(a, b, c)
+    latex = expr_tuple.latex()
+    assert latex in expr_tuple._style_data.formatted_cache.values()
+    assert expr_tuple.latex() == latex
+    # Shared by ExprTuples with the same style and meaning.
+    assert ExprTuple(a, b, c).latex() == latex
+
+
+def test_formatted_cache_forgotten_after_new_proof(record_new_proof):
+    expr_tuple = ExprTuple(a, b, c)
+    latex = expr_tuple.latex()
+    record_new_proof()
+    style_data = expr_tuple._style_data
+    assert style_data.formatted_record_count != Judgment.proof_record_count
+    assert expr_tuple.latex() == latex
+    assert style_data.formatted_record_count == Judgment.proof_record_count
+    assert list(style_data.formatted_cache.values()) == [latex]
+
+
+def test_formatted_cache_per_style():
+    expr_tuple = ExprTuple(a, b, c)
+    wrapped_expr_tuple = expr_tuple.with_wrapping_at(2)
+    assert wrapped_expr_tuple._style_data is not expr_tuple._style_data
+    latex = expr_tuple.latex()
+    wrapped_latex = wrapped_expr_tuple.latex()
+    assert wrapped_latex != latex
+    assert expr_tuple.latex() == latex
+    assert wrapped_expr_tuple.latex() == wrapped_latex
+    assert ExprTuple(a, b, c).with_wrapping_at(2).latex() == wrapped_latex
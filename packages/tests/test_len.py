@@ -0,0 +1,35 @@
+import pytest
+
+# Len and its theorems need the built theory packages.
+tuples = pytest.importorskip('proveit.core_expr_types.tuples',
+                             exc_type=ImportError)
+from proveit import ExprTuple, Variable
+
+Len = tuples.Len
+a, b, c = Variable('a'), Variable('b'), Variable('c')
+
+
+def test_computation_cache_hit():
+    len_expr = Len(ExprTuple(a, b, c))
+    computation = len_expr.computation()
+    assert len_expr.computation() is computation
+    assert Len(ExprTuple(a, b, c)).computation() is computation
+    assert len_expr.typical_eq() is len_expr.typical_eq()
+
+
+def test_computation_cache_after_new_proof(record_new_proof):
+    len_expr = Len(ExprTuple(a, b, c))
+    computation = len_expr.computation()
+    record_new_proof()
+    assert len_expr.computation().expr == computation.expr
+
+
+def test_computation_cache_per_style():
+    len_expr = Len(ExprTuple(a, b, c))
+    styled_len_expr = Len(ExprTuple(a, b, c).with_wrapping_at(2))
+    assert styled_len_expr._style_id != len_expr._style_id
+    computation = len_expr.computation()
+    styled_computation = styled_len_expr.computation()
+    assert styled_computation.expr == computation.expr
+    assert styled_len_expr.computation() is styled_computation
+    assert len_expr.computation() is computation
@@ -0,0 +1,29 @@
+import pytest
+
+# Number sets need the built theory packages.
+numbers = pytest.importorskip('proveit.numbers', exc_type=ImportError)
+from proveit import Judgment
+from proveit.numbers import number_operation
+
+readily_provable_number_set = numbers.readily_provable_number_set
+Add, NaturalPos, num = numbers.Add, numbers.NaturalPos, numbers.num
+
+
+def test_readily_provable_number_set_remembered(record_new_proof):
+    two = num(2)
+    assert readily_provable_number_set(two) == NaturalPos
+    remembered = number_operation._readily_provable_number_sets
+    assert NaturalPos in remembered.values()
+    assert readily_provable_number_set(two) == NaturalPos
+    record_new_proof()
+    assert readily_provable_number_set(two) == NaturalPos
+    assert (number_operation._readily_provable_number_sets_record_count
+            == Judgment.proof_record_count)
+
+
+def test_readily_provable_number_set_across_styles():
+    expr = Add(num(2), num(3))
+    styled_expr = expr.with_styles(operation='function')
+    assert styled_expr._style_id != expr._style_id
+    assert (readily_provable_number_set(styled_expr) ==
+            readily_provable_number_set(expr) == NaturalPos)
@@ -0,0 +1,12 @@
+from proveit._core_ import theory
+from proveit._core_.theory import Theory, _has_init_file
+
+
+def test_has_init_file_remembers_only_found_files(tmp_path):
+    directory = str(tmp_path)
+    assert not _has_init_file(directory)
+    (tmp_path / '__init__.py').write_text('')
+    assert _has_init_file(directory)
+    assert directory in theory._dirs_with_init_file
+    Theory._clear_()
+    assert directory not in theory._dirs_with_init_file
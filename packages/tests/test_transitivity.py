@@ -0,0 +1,32 @@
+import pytest
+
+# The ordering relations need the built theory packages.
+numbers = pytest.importorskip('proveit.numbers', exc_type=ImportError)
+from proveit import Variable
+from proveit.relation import TransitiveRelation, TransitivityException
+
+Less = numbers.Less
+a, b, c = Variable('a'), Variable('b'), Variable('c')
+
+
+def test_failed_transitivity_search_remembered(record_new_proof):
+    for _ in range(2):
+        with pytest.raises(TransitivityException):
+            Less._transitivity_search(a, c, assumptions=[Less(a, b)],
+                                      automation=False)
+        assert len(TransitiveRelation._failed_searches()) > 0
+    record_new_proof()
+    assert len(TransitiveRelation._failed_searches()) == 0
+
+
+def test_transitivity_search_after_failure():
+    assumptions = [Less(a, b), Less(b, c)]
+    with pytest.raises(TransitivityException):
+        Less._transitivity_search(a, c, assumptions=assumptions,
+                                  automation=False)
+    # With automation, the search is made despite the earlier failure.
+    relation = Less._transitivity_search(a, c, assumptions=assumptions)
+    assert relation.expr == Less(a, c)
+    styled_relation = Less(a, c).with_styles(operation='function').prove(
+        assumptions=assumptions)
+    assert styled_relation.expr == relation.expr